@@ -0,0 +1,144 @@
+"""
+Benchmarks for the modular multiply-and-reduce loops used by the classical
+order finders and by step 6 of Ekera's algorithm. Each loop is timed with
+Python integers (allocating a new integer per step), with immutable gmpy2 mpz
+operands, and in place on an xmpz accumulator with ModularReducer and with
+BarrettReducer below, which is slower than GMP's division at every size and
+is only kept here for comparison.
+
+Run from the repository root:
+
+    python benchmarks/bench_modular_loops.py
+"""
+import time
+import gmpy2
+
+from number_factorer.Order_Finding.Classical.order_aux.modular_reducer import ModularReducer
+
+STEPS = 200000
+
+class BarrettReducer(ModularReducer):
+    """
+    Barrett reduction: the quotient of x by the modulus is estimated with two shifts
+    and a multiplication by the precomputed mu = floor(4 ** k / modulus), where k is
+    the bit length of the modulus, followed by at most two corrective subtractions.
+    Valid for 0 <= x < modulus ** 2.
+    """
+    __slots__ = ('shift', 'mu')
+
+    def __init__(self, modulus: int):
+        super().__init__(modulus)
+        self.shift = self.modulus.bit_length()
+        self.mu = gmpy2.mpz(1 << (2 * self.shift)) // self.modulus
+
+    def reduce(self, x):
+        q = ((x >> (self.shift - 1)) * self.mu) >> (self.shift + 1)
+        x -= q * self.modulus
+
+        while x >= self.modulus:
+            x -= self.modulus
+
+    def mul(self, x, y):
+        x *= y
+        self.reduce(x)
+
+    def square(self, x):
+        x *= x
+        self.reduce(x)
+
+def python_multiply(base, modulus):
+    x = 1
+    for _ in range(STEPS):
+        x = (x * base) % modulus
+    return x
+
+def mpz_multiply(base, modulus):
+    base, modulus = gmpy2.mpz(base), gmpy2.mpz(modulus)
+    x = gmpy2.mpz(1)
+    for _ in range(STEPS):
+        x = (x * base) % modulus
+    return x
+
+def reducer_multiply(reducer_class):
+    def loop(base, modulus):
+        reducer = reducer_class(modulus)
+        base = gmpy2.mpz(base)
+        x = reducer.element(1)
+        for _ in range(STEPS):
+            reducer.mul(x, base)
+        return x
+    return loop
+
+def inline_multiply(base, modulus):
+    reducer = ModularReducer(modulus)
+    modulus = reducer.modulus
+    base = gmpy2.mpz(base)
+    x = reducer.element(1)
+    for _ in range(STEPS):
+        x *= base
+        x %= modulus
+    return x
+
+def python_square(base, modulus):
+    x = base
+    for _ in range(STEPS):
+        x = pow(x, 2, modulus)
+    return x
+
+def reducer_square(reducer_class):
+    def loop(base, modulus):
+        reducer = reducer_class(modulus)
+        x = reducer.element(base)
+        for _ in range(STEPS):
+            reducer.square(x)
+        return x
+    return loop
+
+def inline_square(base, modulus):
+    reducer = ModularReducer(modulus)
+    modulus = reducer.modulus
+    x = reducer.element(base)
+    for _ in range(STEPS):
+        x *= x
+        x %= modulus
+    return x
+
+LOOPS = {
+    'multiply': [
+        ('python int', python_multiply),
+        ('mpz', mpz_multiply),
+        ('ModularReducer', reducer_multiply(ModularReducer)),
+        ('BarrettReducer', reducer_multiply(BarrettReducer)),
+        ('xmpz inline', inline_multiply),
+    ],
+    'square': [
+        ('python int', python_square),
+        ('ModularReducer', reducer_square(ModularReducer)),
+        ('BarrettReducer', reducer_square(BarrettReducer)),
+        ('xmpz inline', inline_square),
+    ],
+}
+
+def main():
+    for bits in (31, 61, 127, 1024, 2048):
+        modulus = int(gmpy2.next_prime(1 << (bits - 1)))
+        base = pow(3, 1000, modulus)
+
+        for loop_name, variants in LOOPS.items():
+            reference = None
+
+            for name, loop in variants:
+                start = time.perf_counter()
+                result = int(loop(base, modulus))
+                elapsed = time.perf_counter() - start
+
+                if reference is None:
+                    reference = result
+                assert result == reference, name
+
+                print(f'{bits:5d} bits  {loop_name:8s}  {name:15s}  {1e9 * elapsed / STEPS:8.1f} ns/step')
+
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Import-time regression check for classical-only use. Imports number_factorer in
+a fresh interpreter, factors a small number with a classical order finder and
+fails if any Qiskit module was loaded along the way, or if the import took
+longer than --max-seconds.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/check_import_time.py
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ('qiskit', 'qiskit_aer')
+
+PROBE = """
+import json, resource, sys, time
+
+start = time.perf_counter()
+from number_factorer import Number_Factorer, BabyGiantOrder, RhoOrder, ShorFactorization, EkeraFactorization, ShorOrder
+import number_factorer.cli
+elapsed = time.perf_counter() - start
+
+Number_Factorer(ShorFactorization(), RhoOrder()).factor(1001)
+Number_Factorer(EkeraFactorization(), BabyGiantOrder()).factor(4087)
+
+heavy = sorted(m for m in sys.modules if m.split('.')[0] in %r)
+print(json.dumps({'seconds': elapsed, 'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 'heavy': heavy}))
+""" % (HEAVY_MODULES,)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--max-seconds', type=float, default=1.0,
+                        help='largest acceptable import time (default: 1.0)')
+    args = parser.parse_args()
+
+    output = subprocess.run([sys.executable, '-c', PROBE], check=True, capture_output=True, text=True).stdout
+    report = json.loads(output.strip().splitlines()[-1])
+
+    print(f"import time: {report['seconds']:.3f} s, peak RSS: {report['max_rss_kb'] / 1024:.1f} MB")
+
+    failed = False
+
+    if report['heavy']:
+        print(f"classical use loaded {len(report['heavy'])} Qiskit modules, e.g. {report['heavy'][0]}")
+        failed = True
+
+    if report['seconds'] > args.max_seconds:
+        print(f"import took longer than {args.max_seconds} s")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -7,8 +7,8 @@ from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_or
 from number_factorer.Order_Finding.Quantum.quantum_aux.QFT import QFT
 from number_factorer.Order_Finding.Quantum.quantum_aux.mod_multiply import shorU
 
-from number_factorer.Classical_Factoring.ekera_factorizer import primes_below_cutoff
-from number_factorer.Classical_Factoring.ekera_aux.factor_list_helpers import add_factor, power_refine, factorization_complete
+from number_factorer.Classical_Factoring.ekera_aux.smooth_multiplier import smooth_multiplier
+from number_factorer.Classical_Factoring.common_aux.factor_set import FactorSet
 
 def ekera_estimate_time(number: int, order_algo, bit_cutoff: int = 2, factoring_rounds: int = 40):
     """
@@ -17,8 +17,8 @@ def ekera_estimate_time(number: int, order_algo, bit_cutoff: int = 2, factoring_
     a single run of an order-finding algorithm" by Martin Ekera
     """
     start = time.perf_counter()
-    #0. Initialize list of factors
-    factor_list = [(number, 1)]
+    #0. Initialize set of factors
+    factors = FactorSet([(number, 1)])
 
     #1. Randomly choose an invertible element of {0, ..., number - 1}
 
@@ -48,19 +48,7 @@ def ekera_estimate_time(number: int, order_algo, bit_cutoff: int = 2, factoring_
 
 
     #4. Combine all possible factors
-    prime_list = primes_below_cutoff(m)
-
-    for q in prime_list:
-        exponent = 0
-        x = 1
-
-        while x < m:
-            x = x * q
-            exponent += 1
-
-        factor = q ** (exponent - 1)
-
-        r = r * factor
+    r = r * smooth_multiplier(m)
     
     #5. Extract the highest power of 2 dividing r and the remaining odd part
     even_exponent = 0
@@ -91,20 +79,16 @@ def ekera_estimate_time(number: int, order_algo, bit_cutoff: int = 2, factoring_
             # potential factor
             d = gmpy2.gcd(x - 1, number)
 
-            # add to list if non-trivial, return reduced list
+            # split the factors with it if non-trivial, reducing any powers
             if d > 1:
-                factor_list = add_factor(factor_list, d)
-            
-            # reduce any powers
-            factor_list = power_refine(factor_list)
-            
-            # halt if full factorization is complete
-            if factorization_complete(factor_list):
-                end = time.perf_counter()
-                return (end - start) - (l2 - l1) + extra_time
-            
-            else:
-                x = pow(x, 2, number)
+                factors.split(d)
+
+                # halt if full factorization is complete
+                if factors.complete():
+                    end = time.perf_counter()
+                    return (end - start) - (l2 - l1) + extra_time
+
+            x = pow(x, 2, number)
             
             if x == 1:
                 break
@@ -2,7 +2,7 @@ import random
 import time
 import gmpy2
 
-from number_factorer.Classical_Factoring.shor_aux.is_power import kroot
+from number_factorer.Classical_Factoring.common_aux.perfect_power import perfect_power
 from number_factorer.Classical_Factoring.shor_aux.refine import consolidate_pairs
 
 from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order
@@ -55,11 +55,10 @@ def shor_estimate_time(number, quantum_order_name):
                 continue
 
             # apply classical perfect power test to refine factor list
-            elif gmpy2.is_power(a[0]):
+            elif perfect_power(a[0])[1] > 1:
 
-                b = kroot(a[0])
-                b[1] = b[1] * a[1]
-                new_list.append(tuple(b))
+                base, exponent = perfect_power(a[0])
+                new_list.append((base, exponent * a[1]))
 
             # apply Shor's splitting algorithm to each remaining factor
             # splits factor a into two integers x, y with x * y == a
@@ -0,0 +1,253 @@
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.product_tree import product_tree, remainder_tree
+
+"""
+Factoring into coprimes (Bernstein). A coprime base stores a number as a product
+a_1 ** n_1 * ... * a_k ** n_k whose bases a_i are pairwise coprime. Product and
+remainder trees find the few bases that share a factor with a new divisor, so
+only those bases are refined and the rest of the base is left alone.
+
+The bases are kept in blocks whose sizes decrease by at least half from one block
+to the next, each with its own product tree, so a new base only costs the merge
+of a few small blocks rather than rebuilding one tree over every base (the
+logarithmic method of Bentley and Saxe). Bases that are refined away stay in their
+block's tree until half of the block is gone, and the block is then rebuilt.
+
+The touched bases are refined with each other by pairwise gcds rather than by
+Bernstein's tree-based refinement. That is quadratic in the number of touched
+bases, which is small for a divisor found by order finding, while finding them
+stays near-linear in the total size of the base.
+"""
+
+# below this many bases a plain gcd scan is cheaper than building a tree
+TREE_THRESHOLD = 16
+
+def coprime_pairs(pairs) -> dict:
+    """
+    Refines a short list of pairs [(a_1, n_1), ..., (a_k, n_k)] into a dictionary
+    {b_1: m_1, ..., b_l: m_l} with pairwise coprime keys b_i > 1 and the same
+    product a_1 ** n_1 * ... * a_k ** n_k == b_1 ** m_1 * ... * b_l ** m_l.
+    """
+    base = {}
+    stack = list(pairs)
+
+    while stack:
+        value, exponent = stack.pop()
+
+        if value == 1:
+            continue
+
+        for element in base:
+            d = gmpy2.gcd(value, element)
+
+            if d != 1:
+                break
+
+        else:
+            base[value] = exponent
+            continue
+
+        # value = (value / d) * d and element = (element / d) * d
+        element_exponent = base.pop(element)
+        stack.extend([(element // d, element_exponent), (d, element_exponent + exponent), (value // d, exponent)])
+
+    return base
+
+class _Block:
+    """
+    A block of bases together with the product tree over them, for blocks large
+    enough to need one. live holds the bases that have not been removed since.
+    """
+
+    __slots__ = ('values', 'live', 'tree')
+
+    def __init__(self, values: list):
+        self.values = values
+        self.live = set(values)
+        self.tree = product_tree(values) if len(values) >= TREE_THRESHOLD else None
+
+    def touched(self, value: int) -> list:
+        """
+        Returns the pairs (element, gcd(element, value)) for the live bases of the block
+        sharing a factor with value.
+        """
+        if self.tree is None:
+            gcds = [gmpy2.gcd(value, element) for element in self.values]
+
+        else:
+            # value mod a_i is no larger than a_i, so each gcd is between numbers of the size of a_i
+            gcds = [gmpy2.gcd(remainder, element) for remainder, element in zip(remainder_tree(value, self.tree), self.values)]
+
+        return [(element, d) for element, d in zip(self.values, gcds) if d != 1 and element in self.live]
+
+class CoprimeBase:
+    """
+    A factorization [(a_1, n_1), ..., (a_k, n_k)] of a number, kept so that the bases
+    a_i are pairwise coprime. add multiplies the number by a new factor and split
+    refines the bases with a divisor of the number; both only touch the bases that
+    share a factor with the new integer.
+    """
+
+    __slots__ = ('elements', '_blocks', '_block_of', '_pending')
+
+    def __init__(self, pairs=()):
+        self.elements = {}
+        self._blocks = []
+        self._block_of = {}
+        self._pending = {}
+
+        pairs = [(value, exponent) for value, exponent in pairs if value != 1]
+
+        if len(pairs) < TREE_THRESHOLD:
+            for value, exponent in pairs:
+                self.add(value, exponent)
+
+            return
+
+        # batch gcd: gcd(a_i, P / a_i), where P is the product of all a_i, is computed
+        # from P mod a_i ** 2 and is 1 exactly when a_i is coprime to every other base
+        values = [gmpy2.mpz(value) for value, _ in pairs]
+        total = product_tree(values)[-1][0]
+        remainders = remainder_tree(total, product_tree([value * value for value in values]))
+
+        shared = []
+
+        for (value, exponent), remainder, v in zip(pairs, remainders, values):
+            if gmpy2.gcd(remainder // v, v) == 1:
+                self._insert(value, exponent)
+            else:
+                shared.append((value, exponent))
+
+        for value, exponent in shared:
+            self.add(value, exponent)
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        return iter(self.elements.items())
+
+    def pairs(self) -> list:
+        """
+        Returns the factorization as a list of pairs sorted by base.
+        """
+        return sorted(self.elements.items(), key=lambda x: x[0])
+
+    def _touched(self, value: int) -> list:
+        """
+        Returns the pairs (element, gcd(element, value)) for the bases sharing a factor
+        with value.
+        """
+        self._flush()
+
+        return [pair for block in self._blocks for pair in block.touched(value)]
+
+    def _flush(self):
+        """
+        Moves the bases inserted since the last query into a block of their own, then
+        merges the trailing blocks while the last is at least half the size of the
+        one before it.
+        """
+        if not self._pending:
+            return
+
+        self._add_block(list(self._pending))
+        self._pending.clear()
+
+        while len(self._blocks) > 1 and 2 * len(self._blocks[-1].live) >= len(self._blocks[-2].live):
+            last = self._blocks.pop()
+            previous = self._blocks.pop()
+            self._add_block(list(previous.live) + list(last.live))
+
+    def _add_block(self, values: list, index: int = None):
+        block = _Block(values)
+        self._blocks.insert(len(self._blocks) if index is None else index, block)
+
+        for value in values:
+            self._block_of[value] = block
+
+    def _insert(self, value: int, exponent: int):
+        if value in self.elements:
+            self.elements[value] += exponent
+            return
+
+        self.elements[value] = exponent
+        self._pending[value] = None
+
+    def _remove(self, value: int):
+        del self.elements[value]
+
+        block = self._block_of.pop(value, None)
+
+        if block is None:
+            del self._pending[value]
+            return
+
+        block.live.discard(value)
+
+        # rebuild a block once half of it is gone, so removed bases cost at most as
+        # much tree as the live ones
+        if 2 * len(block.live) < len(block.values):
+            self._blocks.remove(block)
+
+            if block.live:
+                self._add_block(list(block.live), self._position(len(block.live)))
+
+    def _position(self, size: int) -> int:
+        """
+        Returns the index at which a block of size live bases keeps the blocks sorted
+        by decreasing size.
+        """
+        for i, block in enumerate(self._blocks):
+            if len(block.live) < size:
+                return i
+
+        return len(self._blocks)
+
+    def _replace(self, removed: list, pieces: list):
+        for element in removed:
+            self._remove(element)
+
+        for value, exponent in pieces:
+            self._insert(value, exponent)
+
+    def add(self, value: int, exponent: int = 1):
+        """
+        Multiplies the number by value ** exponent.
+        """
+        if value == 1:
+            return
+
+        touched = self._touched(value)
+
+        if not touched:
+            self._insert(value, exponent)
+            return
+
+        # the pieces of value and the touched bases are coprime to every untouched base
+        removed = [element for element, _ in touched]
+        pieces = [(value, exponent)] + [(element, self.elements[element]) for element in removed]
+        self._replace(removed, coprime_pairs(pieces).items())
+
+    def split(self, divisor: int):
+        """
+        Refines the bases with divisor, a divisor of the number, leaving the number
+        itself unchanged. Each base a sharing d = gcd(a, divisor) with divisor is
+        replaced by the coprime refinement of a / d and d.
+        """
+        touched = self._touched(divisor)
+
+        if not touched:
+            return
+
+        removed = []
+        pieces = []
+
+        # pieces of distinct bases are coprime, so each base is refined on its own
+        for element, d in touched:
+            exponent = self.elements[element]
+            removed.append(element)
+            pieces.extend(coprime_pairs([(element // d, exponent), (d, exponent)]).items())
+
+        self._replace(removed, pieces)
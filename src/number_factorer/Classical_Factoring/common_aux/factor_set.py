@@ -0,0 +1,44 @@
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.coprime_base import CoprimeBase
+from number_factorer.Classical_Factoring.common_aux.perfect_power import perfect_power
+
+class FactorSet(CoprimeBase):
+    """
+    A coprime factorization [(a_1, n_1), ..., (a_k, n_k)] that knows which of its bases
+    are prime. Every base is tested for primality and reduced to a non-power once, when
+    it enters the set, so asking whether the factorization is complete is a comparison
+    of two counts and splitting an entry only tests the new pieces.
+    """
+
+    __slots__ = ('primes',)
+
+    def __init__(self, pairs=()):
+        self.primes = set()
+        super().__init__(pairs)
+
+    def _insert(self, value: int, exponent: int):
+        base, power = perfect_power(value)
+        super()._insert(base, exponent * power)
+
+        if gmpy2.is_prime(base):
+            self.primes.add(base)
+
+    def _remove(self, value: int):
+        super()._remove(value)
+        self.primes.discard(value)
+
+    def composite_count(self) -> int:
+        return len(self.elements) - len(self.primes)
+
+    def complete(self) -> bool:
+        """
+        Returns True if every base is prime.
+        """
+        return len(self.elements) == len(self.primes)
+
+    def composites(self) -> list:
+        """
+        Returns the bases that are not prime.
+        """
+        return [value for value in self.elements if value not in self.primes]
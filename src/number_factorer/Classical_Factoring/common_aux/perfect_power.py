@@ -0,0 +1,71 @@
+import functools
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.prime_sieve import primes_below
+
+"""
+Perfect power detection. A number is a k-th power for composite k only if it is
+a p-th power for each prime p dividing k, so only prime exponents are tried and
+the maximal exponent is found by recursing on the base. Before a p-th root is
+taken, the candidate exponent p is checked against the 2-adic valuation of the
+number and against p-th power residues modulo a few primes q = 1 mod p, which
+rules out almost every exponent without a root extraction.
+"""
+
+# number of primes q = 1 mod p used to sieve each exponent p
+SIEVE_PRIMES = 4
+
+@functools.lru_cache(maxsize=None)
+def sieve_moduli(p: int) -> tuple:
+    """
+    Returns the first SIEVE_PRIMES primes q with q = 1 mod p. Modulo such q only
+    one in p nonzero residues is a p-th power.
+    """
+    moduli = []
+    q = p + 1
+
+    while len(moduli) < SIEVE_PRIMES:
+        if gmpy2.is_prime(q):
+            moduli.append((q, (q - 1) // p))
+
+        q += p
+
+    return tuple(moduli)
+
+def _is_pth_power_residue(number: int, p: int) -> bool:
+    for q, cofactor in sieve_moduli(p):
+        residue = number % q
+
+        if residue and pow(residue, cofactor, q) != 1:
+            return False
+
+    return True
+
+@functools.lru_cache(maxsize=4096)
+def perfect_power(number: int) -> tuple:
+    """
+    Returns (base, exponent) with number = base ** exponent and exponent maximal.
+    The exponent is 1 when number is not a perfect power.
+    """
+    number = int(number)
+
+    if number < 4 or not gmpy2.is_power(number):
+        return number, 1
+
+    # an exponent must divide the exponent of 2 in number if number is even
+    valuation = gmpy2.bit_scan1(number)
+
+    for p in primes_below(number.bit_length() + 1).tolist():
+        if valuation and valuation % p:
+            continue
+
+        if not _is_pth_power_residue(number, p):
+            continue
+
+        root, exact = gmpy2.iroot(number, p)
+
+        if exact:
+            base, exponent = perfect_power(int(root))
+            return base, exponent * p
+
+    return number, 1
@@ -0,0 +1,70 @@
+import threading
+import numpy as np
+
+"""
+A process-wide table of small primes, grown on demand by a segmented Sieve of
+Eratosthenes. The table only ever grows, so a query for the primes below m is
+a binary search and a slice once the table reaches m. Segments are sieved
+SEGMENT_SIZE integers at a time, so growing the table needs memory for one
+segment plus the primes themselves.
+"""
+
+SEGMENT_SIZE = 1 << 18
+
+_lock = threading.Lock()
+
+# primes below _limit, as a read-only int64 array
+_primes = np.array([2, 3, 5, 7], dtype=np.int64)
+_limit = 10
+
+def _sieve_segment(low: int, high: int, base_primes: np.ndarray) -> np.ndarray:
+    """
+    Returns the primes in [low, high), given all primes p with p * p < high.
+    """
+    is_prime = np.ones(high - low, dtype=bool)
+
+    for p in base_primes:
+        p = int(p)
+
+        if p * p >= high:
+            break
+
+        start = max(p * p, -(-low // p) * p)
+        is_prime[start - low::p] = False
+
+    return np.flatnonzero(is_prime) + low
+
+def _extend(limit: int):
+    """
+    Grows the table to contain every prime below limit, at least doubling it.
+    """
+    global _primes, _limit
+
+    limit = max(limit, 2 * _limit)
+
+    # the sieving primes up to sqrt(limit) must be known first
+    if _limit * _limit < limit:
+        _extend(int(limit ** 0.5) + 1)
+
+    segments = [_primes]
+
+    for low in range(_limit, limit, SEGMENT_SIZE):
+        segments.append(_sieve_segment(low, min(low + SEGMENT_SIZE, limit), _primes))
+
+    primes = np.concatenate(segments)
+    primes.flags.writeable = False
+
+    _primes, _limit = primes, limit
+
+def primes_below(m: int) -> np.ndarray:
+    """
+    Returns a read-only NumPy int64 array of all primes q with q < m.
+    """
+    if m > _limit:
+        with _lock:
+            if m > _limit:
+                _extend(m)
+
+    primes = _primes
+
+    return primes[:np.searchsorted(primes, m)]
@@ -0,0 +1,41 @@
+import gmpy2
+
+"""
+Balanced product trees. Multiplying a list of numbers pairwise, level by level,
+keeps both operands of every multiplication about the same size, which is far
+cheaper than accumulating a running product one small factor at a time.
+"""
+
+def product_tree(values) -> list:
+    """
+    Returns the product tree of values as a list of levels: level 0 holds the values
+    themselves (as mpz), each following level the products of adjacent pairs of the
+    level below, and the last level the single product of all values.
+    """
+    level = [gmpy2.mpz(v) for v in values] or [gmpy2.mpz(1)]
+    tree = [level]
+
+    while len(level) > 1:
+        level = [level[i] * level[i + 1] if i + 1 < len(level) else level[i] for i in range(0, len(level), 2)]
+        tree.append(level)
+
+    return tree
+
+def tree_product(values):
+    """
+    Returns the product of values, computed with a balanced product tree.
+    """
+    return product_tree(values)[-1][0]
+
+def remainder_tree(number: int, tree: list) -> list:
+    """
+    Given the product tree of values v_1, ..., v_k, returns [number % v_1, ..., number % v_k].
+    number is reduced modulo each node on the way down, so every division is by a
+    number about the size of the dividend.
+    """
+    remainders = [number % tree[-1][0]]
+
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i // 2] % v for i, v in enumerate(level)]
+
+    return remainders
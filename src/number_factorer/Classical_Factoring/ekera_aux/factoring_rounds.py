@@ -0,0 +1,92 @@
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+import gmpy2
+
+from number_factorer.Order_Finding.Classical.order_aux.modular_reducer import ModularReducer
+from number_factorer.Orchestration.worker_pools import terminate_pool
+
+"""
+The factoring rounds of step 6 of Ekera's algorithm. Each round raises a random x
+to the odd part r of the order multiple and takes gcds along the chain of
+squarings; rounds share nothing but r, so they can run on a pool of processes.
+"""
+
+# seconds between budget checks while waiting for the workers
+POLL_INTERVAL = 0.05
+
+_round_args = None
+
+def factoring_round(x: int, r: int, even_exponent: int, number: int) -> list:
+    """
+    Returns the non-trivial divisors gcd(y - 1, number) for y = x ** (r * 2 ** i) mod
+    number, 0 <= i <= even_exponent, stopping once y == 1.
+    """
+    # the squarings below are done in place on a single xmpz accumulator
+    reducer = ModularReducer(number)
+    modulus = reducer.modulus
+
+    # raise to maximal odd power
+    x = reducer.element(gmpy2.powmod(x, r, modulus))
+    divisors = []
+
+    for _ in range(even_exponent + 1):
+        if x == 1:
+            break
+
+        # potential factor
+        x -= 1
+        d = gmpy2.gcd(x, modulus)
+        x += 1
+
+        if d > 1:
+            divisors.append(d)
+
+        x *= x
+        x %= modulus
+
+    return divisors
+
+def _init_rounds(r: int, even_exponent: int, number: int):
+    """
+    Pool initializer: keeps r, even_exponent and number for the lifetime of the worker.
+    """
+    global _round_args
+
+    _round_args = (r, even_exponent, number)
+
+def _run_round(x: int) -> list:
+    return factoring_round(x, *_round_args)
+
+def parallel_factoring_rounds(factors, draws: list, r: int, even_exponent: int, number: int, workers: int = None,
+                              budget=None):
+    """
+    Runs a factoring round for each x in draws on workers processes (all cores if
+    None), splitting the FactorSet factors with each divisor as soon as its round
+    finishes. Rounds still outstanding when factors is complete, or when the
+    FactoringBudget budget, if given, runs out, are cancelled, and the workers still
+    running one are terminated.
+    """
+    workers = workers or multiprocessing.cpu_count()
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_rounds,
+                               initargs=(gmpy2.mpz(r), even_exponent, gmpy2.mpz(number)))
+
+    futures = []
+
+    try:
+        futures = [pool.submit(_run_round, x) for x in draws]
+        pending = set(futures)
+
+        while pending and not factors.complete() and not (budget is not None and budget.expired()):
+            done, pending = wait(pending, timeout=POLL_INTERVAL if budget is not None else None,
+                                 return_when=FIRST_COMPLETED)
+
+            for future in done:
+                for d in future.result():
+                    factors.split(d)
+
+    finally:
+        if all(future.done() for future in futures):
+            pool.shutdown(wait=True)
+        else:
+            terminate_pool(pool)
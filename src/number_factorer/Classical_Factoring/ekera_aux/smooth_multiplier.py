@@ -0,0 +1,65 @@
+import functools
+import json
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.prime_sieve import primes_below
+from number_factorer.Classical_Factoring.common_aux.product_tree import tree_product
+
+"""
+The multiplier applied to the order in step 4 of Ekera's algorithm: the product,
+over all primes q < m, of the largest power of q below m. It only depends on
+m = bit_cutoff * bitlength(N), so it is computed once per m with a product
+tree and memoized. Multipliers for standard key sizes can be precomputed into a
+file and loaded at startup.
+"""
+
+# multipliers read from disk with load_smooth_multipliers, keyed by m
+_loaded = {}
+
+@functools.lru_cache(maxsize=64)
+def _compute_smooth_multiplier(m: int):
+    prime_powers = []
+
+    for q in primes_below(m).tolist():
+        power = q
+
+        while power * q < m:
+            power *= q
+
+        prime_powers.append(power)
+
+    return tree_product(prime_powers)
+
+def smooth_multiplier(m: int):
+    """
+    Returns the product over all primes q < m of the largest power of q below m.
+    """
+    if m in _loaded:
+        return _loaded[m]
+
+    return _compute_smooth_multiplier(m)
+
+def precompute_smooth_multipliers(path: str, bit_lengths, bit_cutoff: int = 2):
+    """
+    Computes the multipliers used when factoring numbers of each of the given bit
+    lengths with the given bit_cutoff and saves them to the JSON file at path.
+    """
+    multipliers = {}
+
+    for bits in bit_lengths:
+        m = bit_cutoff * bits
+        multipliers[str(m)] = gmpy2.digits(smooth_multiplier(m), 16)
+
+    with open(path, 'w') as file:
+        json.dump(multipliers, file)
+
+def load_smooth_multipliers(path: str):
+    """
+    Loads multipliers saved by precompute_smooth_multipliers, so they are not
+    recomputed in this process.
+    """
+    with open(path) as file:
+        multipliers = json.load(file)
+
+    for m, digits in multipliers.items():
+        _loaded[int(m)] = gmpy2.mpz(digits, 16)
@@ -1,19 +1,47 @@
 import gmpy2
 import random
-from number_factorer.Classical_Factoring.ekera_aux.factor_list_helpers import add_factor, power_refine, factorization_complete
-from number_factorer.Classical_Factoring.ekera_aux.prime_below_cutoff import primes_below_cutoff
+from number_factorer.Classical_Factoring.common_aux.factor_set import FactorSet
+from number_factorer.Classical_Factoring.ekera_aux.smooth_multiplier import smooth_multiplier
+from number_factorer.Classical_Factoring.shor_aux.refine import consolidate_pairs
+from number_factorer.Classical_Factoring.ekera_aux.factoring_rounds import factoring_round, parallel_factoring_rounds
+from number_factorer.Orchestration.budget import BudgetExhausted
 
 
 
 
-def ekera_factorizer(number: int, order_finder, bit_cutoff: int = 2, factoring_rounds: int = 40):
+def ekera_factorizer(number: int, order_finder, bit_cutoff: int = 2, factoring_rounds: int = 40, prefactor=None, workers: int = 1, budget=None):
     """
     Factors number with one call to an order finding algorithm. An implementation
     of the algorithm found in "On completely factoring any integer efficiently in 
     a single run of an order-finding algorithm" by Martin Ekera
+
+    If prefactor is given, it is called on number and budget first and must return a pair
+    (prime_list, composite_list) as produced by prefactorizer. The algorithm is then
+    only run on the composites that remain.
+
+    The factoring rounds of step 6 are independent. With workers other than 1 they
+    run on a pool of that many processes (all cores if None), and rounds still
+    outstanding once the factorization is complete are cancelled.
+
+    If a FactoringBudget is given as budget, it is checked before the order finding
+    call, and its deadline between factoring rounds. Once it runs out, the factors found so far are
+    returned and may include composites.
     """
-    #0. Initialize list of factors
-    factor_list = [(number, 1)]
+    if prefactor is not None:
+        prime_list, composite_list = prefactor(number, budget)
+
+        for a in composite_list:
+            prime_list.extend((p, n * a[1]) for p, n in ekera_factorizer(a[0], order_finder, bit_cutoff, factoring_rounds,
+                                                                         workers=workers, budget=budget))
+
+        return [(int(factor[0]), factor[1]) for factor in consolidate_pairs(prime_list)]
+
+    #0. Initialize set of factors
+    factors = FactorSet([(number, 1)])
+
+    # nothing to do for a prime or a prime power
+    if factors.complete():
+        return [(int(factor[0]), factor[1]) for factor in factors.pairs()]
 
     #1. Randomly choose an invertible element of {0, ..., number - 1}
 
@@ -23,26 +51,17 @@ def ekera_factorizer(number: int, order_finder, bit_cutoff: int = 2, factoring_r
         g = random.randint(2, number - 1)
 
     #2. Call the order finding algorithm (in this case my very inefficient classical algorithm)
-    r = order_finder.find_order(g, number)
+    try:
+        r = order_finder.find_order(g, number)
+    except BudgetExhausted:
+        return [(int(number), 1)]
 
     #3. Compute the cut-off for finding primes
     m = bit_cutoff * (number.bit_length())
 
 
     #4. Combine all possible factors
-    prime_list = primes_below_cutoff(m)
-
-    for q in prime_list:
-        exponent = 0
-        x = 1
-
-        while x < m:
-            x = x * q
-            exponent += 1
-
-        factor = q ** (exponent - 1)
-
-        r = r * factor
+    r = r * smooth_multiplier(m)
     
     #5. Extract the highest power of 2 dividing r and the remaining odd part
     even_exponent = 0
@@ -52,43 +71,44 @@ def ekera_factorizer(number: int, order_finder, bit_cutoff: int = 2, factoring_r
     
     
     
-    #6. Find the factors 
+    #6. Find the factors
+
+    # a draw sharing a factor with number is a divisor for free
+    draws = []
 
     for _ in range(1, factoring_rounds + 1):
 
         # compute potential source of factors
         x = random.randint(2, number - 1)
+        d = gmpy2.gcd(x, number)
+
+        if d == 1:
+            draws.append(x)
+            continue
 
-        while gmpy2.gcd(g, number) != 1:
-            x = random.randint(2, number - 1)
+        factors.split(d)
 
-        # raise to maximal odd power
-        x = pow(x, r, number)
+        # halt if full factorization is complete
+        if factors.complete():
+            return [(int(factor[0]), factor[1]) for factor in factors.pairs()]
 
-        if x == 1:
-            continue
+    if workers != 1:
+        parallel_factoring_rounds(factors, draws, r, even_exponent, number, workers, budget)
 
-        for i in range(even_exponent + 1):
+    else:
+        for x in draws:
+
+            # stop with a partial factorization once the budget has run out
+            if budget is not None and budget.expired():
+                break
 
-            # potential factor
-            d = gmpy2.gcd(x - 1, number)
+            # split the factors with each non-trivial divisor, reducing any powers
+            for d in factoring_round(x, r, even_exponent, number):
+                factors.split(d)
 
-            # add to list if non-trivial, return reduced list
-            if d > 1:
-                factor_list = add_factor(factor_list, d)
-            
-            # reduce any powers
-            factor_list = power_refine(factor_list)
-            
             # halt if full factorization is complete
-            if factorization_complete(factor_list):
-                return [(int(factor[0]), factor[1]) for factor in factor_list]
-            
-            else:
-                x = pow(x, 2, number)
-            
-            if x == 1:
+            if factors.complete():
                 break
 
     #7. Return factor list
-    return [(int(factor[0]), factor[1]) for factor in factor_list]
\ No newline at end of file
+    return [(int(factor[0]), factor[1]) for factor in factors.pairs()]
\ No newline at end of file
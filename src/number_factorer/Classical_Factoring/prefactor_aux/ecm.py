@@ -0,0 +1,87 @@
+import random
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.prime_sieve import primes_below
+from number_factorer.Classical_Factoring.prefactor_aux.pollard_pm1 import largest_power
+from number_factorer.Orchestration.budget import CHECK_INTERVAL
+
+"""
+Lenstra's elliptic curve method, stage one, on Montgomery curves
+B y^2 = x^3 + A x^2 + x with Suyama's parametrization. Points are kept in
+projective (X : Z) coordinates and multiplied with the Montgomery ladder, so
+no modular inverses are needed after the curve is set up.
+"""
+
+def _double(x, z, a24, n):
+    s = (x + z) ** 2 % n
+    d = (x - z) ** 2 % n
+    t = s - d
+
+    return s * d % n, t * (d + a24 * t) % n
+
+def _add(x1, z1, x2, z2, x0, z0, n):
+    """
+    Adds (x1 : z1) and (x2 : z2), whose difference is (x0 : z0).
+    """
+    u = (x1 - z1) * (x2 + z2)
+    v = (x1 + z1) * (x2 - z2)
+
+    return z0 * (u + v) ** 2 % n, x0 * (u - v) ** 2 % n
+
+def _multiply(k, x, z, a24, n):
+    """
+    Montgomery ladder for k * (x : z).
+    """
+    x0, z0 = x, z
+    x1, z1 = _double(x, z, a24, n)
+
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            x0, z0 = _add(x1, z1, x0, z0, x, z, n)
+            x1, z1 = _double(x1, z1, a24, n)
+        else:
+            x1, z1 = _add(x0, z0, x1, z1, x, z, n)
+            x0, z0 = _double(x0, z0, a24, n)
+
+    return x0, z0
+
+def ecm(number: int, curves: int, bound: int, budget=None):
+    """
+    Tries up to curves random curves, each multiplying a point by every prime
+    power below bound. Returns a non-trivial divisor of number, or None, also if
+    the FactoringBudget budget, if given, expires first.
+    """
+    n = gmpy2.mpz(number)
+    prime_powers = [largest_power(q, bound) for q in primes_below(bound + 1).tolist()]
+
+    for _ in range(curves):
+        sigma = gmpy2.mpz(random.randint(6, n - 1))
+
+        u = (sigma * sigma - 5) % n
+        v = 4 * sigma % n
+        x = pow(u, 3, n)
+        z = pow(v, 3, n)
+
+        # a24 = (A + 2) / 4 = (v - u) ** 3 * (3u + v) / (16 u ** 3 v)
+        denominator = 16 * x * v % n
+        d = gmpy2.gcd(denominator, n)
+
+        if d != 1:
+            if d != n:
+                return d
+            continue
+
+        a24 = pow(v - u, 3, n) * (3 * u + v) * gmpy2.invert(denominator, n) % n
+
+        for i, k in enumerate(prime_powers, 1):
+            if budget is not None and i % CHECK_INTERVAL == 0 and budget.expired():
+                return None
+
+            x, z = _multiply(k, x, z, a24, n)
+
+        d = gmpy2.gcd(z, n)
+
+        if 1 < d < n:
+            return d
+
+    return None
@@ -0,0 +1,37 @@
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.prime_sieve import primes_below
+from number_factorer.Orchestration.budget import CHECK_INTERVAL
+
+def largest_power(q: int, bound: int) -> int:
+    """
+    Returns the largest power of q not exceeding bound.
+    """
+    power = q
+
+    while power * q <= bound:
+        power *= q
+
+    return power
+
+def pollard_pm1(number: int, bound: int, budget=None):
+    """
+    Stage one of Pollard's p - 1 method. Finds a prime factor p of number
+    whenever p - 1 is bound-powersmooth. Returns a non-trivial divisor of
+    number, or None, also if the FactoringBudget budget, if given, expires first.
+    """
+    number = gmpy2.mpz(number)
+    a = gmpy2.mpz(2)
+
+    for i, q in enumerate(primes_below(bound + 1).tolist(), 1):
+        if budget is not None and i % CHECK_INTERVAL == 0 and budget.expired():
+            return None
+
+        a = gmpy2.powmod(a, largest_power(q, bound), number)
+
+    d = gmpy2.gcd(a - 1, number)
+
+    if 1 < d < number:
+        return d
+
+    return None
@@ -0,0 +1,29 @@
+from number_factorer.Classical_Factoring.common_aux.prime_sieve import primes_below
+
+def trial_division(number: int, bound: int):
+    """
+    Removes all prime factors p <= bound from number. Returns the list
+    [(p_1, n_1), ..., (p_k, n_k)] of primes removed with their multiplicities,
+    together with the remaining cofactor.
+    """
+    prime_list = []
+
+    for p in primes_below(bound + 1).tolist():
+        if p * p > number:
+            break
+
+        if number % p == 0:
+            exponent = 0
+
+            while number % p == 0:
+                number //= p
+                exponent += 1
+
+            prime_list.append((p, exponent))
+
+    # whatever is left below p ** 2 is prime
+    if 1 < number <= bound:
+        prime_list.append((number, 1))
+        number = 1
+
+    return prime_list, number
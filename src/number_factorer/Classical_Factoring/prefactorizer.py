@@ -0,0 +1,66 @@
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.perfect_power import perfect_power
+from number_factorer.Classical_Factoring.shor_aux.refine import consolidate_pairs
+from number_factorer.Classical_Factoring.prefactor_aux.trial_division import trial_division
+from number_factorer.Classical_Factoring.prefactor_aux.pollard_pm1 import pollard_pm1
+from number_factorer.Classical_Factoring.prefactor_aux.ecm import ecm
+from number_factorer.Order_Finding.Classical.order_aux.multiple_reduction import pollard_brent
+
+def prefactorizer(number: int, trial_bound: int = 2 ** 16, rho_iterations: int = 2 ** 14,
+                  pm1_bound: int = 10 ** 4, ecm_curves: int = 8, ecm_bound: int = 2000, budget=None):
+    """
+    Cheap classical factoring to run before order finding. Removes primes below
+    trial_bound by trial division, then splits what is left with Pollard's rho
+    (up to rho_iterations steps), Pollard's p - 1 (with smoothness bound pm1_bound)
+    and the elliptic curve method (ecm_curves curves with bound ecm_bound). A
+    method whose budget is 0 is skipped. Once the FactoringBudget budget, if given,
+    expires, every factor not yet split is left in the composites.
+
+    Returns a pair (prime_list, composite_list) of lists [(a_1, n_1), ..., (a_k, n_k)]
+    whose combined product (a_1 ** n_1) * ... * (a_k ** n_k) is number, where the
+    first holds primes and the second the composites none of the methods could split.
+    """
+    prime_list, cofactor = trial_division(number, trial_bound)
+    composite_list = []
+
+    stack = [(gmpy2.mpz(cofactor), 1)] if cofactor > 1 else []
+
+    while stack:
+        a, n = stack.pop()
+
+        if gmpy2.is_prime(a):
+            prime_list.append((a, n))
+            continue
+
+        if budget is not None and budget.expired():
+            composite_list.append((a, n))
+            continue
+
+        base, exponent = perfect_power(a)
+
+        if exponent > 1:
+            stack.append((gmpy2.mpz(base), n * exponent))
+            continue
+
+        # cheapest methods first, skipping any with a budget of 0
+        d = None
+
+        if rho_iterations > 0:
+            d = pollard_brent(a, rho_iterations, budget)
+
+        if d is None and pm1_bound > 0:
+            d = pollard_pm1(a, pm1_bound, budget)
+
+        if d is None and ecm_curves > 0:
+            d = ecm(a, ecm_curves, ecm_bound, budget)
+
+        if d is None:
+            composite_list.append((a, n))
+        else:
+            stack.extend([(d, n), (a // d, n)])
+
+    prime_list = [(int(p), n) for p, n in consolidate_pairs(prime_list)]
+    composite_list = [(int(a), n) for a, n in consolidate_pairs(composite_list)]
+
+    return prime_list, composite_list
@@ -0,0 +1,88 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+import random
+
+from number_factorer.Classical_Factoring.shor_aux.splitter import splitter
+from number_factorer.Orchestration.budget import BudgetExhausted
+from number_factorer.Orchestration.worker_pools import terminate_pool
+
+"""
+Splitting the composite factors of a number concurrently. Composites are coprime,
+so each can be split independently; they form a work queue on a pool of threads
+or processes, and every composite a split produces is scheduled as soon as it
+appears rather than when its siblings are done.
+"""
+
+# seconds between budget checks while waiting for the workers
+POLL_INTERVAL = 0.05
+
+_splitter_args = None
+
+def _init_splitter(order_finder, bases_per_call: int):
+    """
+    Pool initializer: keeps the order finder for the lifetime of the worker and
+    reseeds the random bases, which forked workers would otherwise share.
+    """
+    global _splitter_args
+
+    random.seed()
+    _splitter_args = (order_finder, bases_per_call)
+
+def _split(number: int):
+    return splitter(number, *_splitter_args)
+
+def concurrent_split(factors, order_finder, bases_per_call: int = 1, workers: int = None, use_threads: bool = False,
+                     budget=None):
+    """
+    Splits the composites of the FactorSet factors with Shor's splitting algorithm on
+    workers processes (all cores if None), or threads if use_threads is True, until
+    only primes remain, or until the FactoringBudget budget, if given, runs out.
+    Splits still outstanding then are cancelled: worker processes are terminated,
+    and worker threads stop at the next budget check of their order finder. Worker
+    processes receive copies of the order finder, so there max_order_calls limits
+    each process separately.
+    """
+    workers = workers or multiprocessing.cpu_count()
+
+    if use_threads:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        submit = lambda a: pool.submit(splitter, a, order_finder, bases_per_call)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_splitter,
+                                   initargs=(order_finder, bases_per_call))
+        submit = lambda a: pool.submit(_split, a)
+
+    pending = {}
+
+    try:
+        while True:
+
+            # schedule every composite that is not already being split
+            scheduled = set(pending.values())
+
+            for a in factors.composites():
+                if a not in scheduled:
+                    pending[submit(a)] = a
+
+            if not pending or (budget is not None and budget.exhausted()):
+                break
+
+            done, _ = wait(pending, timeout=POLL_INTERVAL if budget is not None else None, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                del pending[future]
+
+                try:
+                    split = future.result()
+                except BudgetExhausted:
+                    return
+
+                # a composite splitter gave up on is scheduled again
+                if split is not None:
+                    factors.split(split[0])
+
+    finally:
+        if pending and not use_threads:
+            terminate_pool(pool)
+        else:
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -2,30 +2,43 @@ import gmpy2
 import random
 from typing import List, Tuple
 
-def splitter(number: int, order_finder) -> List[Tuple[int, int]]:
+def splitter(number: int, order_finder, bases_per_call: int = 1) -> List[Tuple[int, int]]:
         """
         The splitting algorithm presented by Shor in REFERENCE. Takes an integer number
         and returns a pair [a, b] of non-trivial factors of number. Requires an order
         finding algorithm.
+
+        With bases_per_call > 1, that many random bases are handed to the order finder
+        in a single find_orders call, and the first one that splits number is used.
         """
         if number % 2 == 0:
             return [2, number // 2]
     
         for _ in range(10):  
-            a = random.randint(2, number - 1)
-            factor = gmpy2.gcd(a, number)
+            bases = []
+
+            for _ in range(bases_per_call):
+                a = random.randint(2, number - 1)
+                factor = gmpy2.gcd(a, number)
+
+                if factor != 1:
+                    return [factor, number // factor]
+
+                bases.append(a)
+
+            if bases_per_call == 1:
+                orders = [order_finder.find_order(bases[0], number)]
+            else:
+                orders = order_finder.find_orders(bases, number)
 
-            if factor != 1:
-                return [factor, number // factor]
+            for a, order in zip(bases, orders):
+                if order is None or order % 2 != 0:
+                    continue
 
-            order = order_finder.find_order(a, number)
-            if order is None or order % 2 != 0:
-                continue
+                x = pow(a, order // 2, number) - 1
+                factor = gmpy2.gcd(x, number)
 
-            x = pow(a, order // 2, number) - 1
-            factor = gmpy2.gcd(x, number)
-            
-            if factor != 1 and factor != number:
-                return [factor, number // factor]
+                if factor != 1 and factor != number:
+                    return [factor, number // factor]
 
         return None  
@@ -1,23 +1,41 @@
-import gmpy2
-from number_factorer.Classical_Factoring.shor_aux.is_power import kroot
-from number_factorer.Classical_Factoring.shor_aux.refine import consolidate_pairs
+from number_factorer.Classical_Factoring.common_aux.factor_set import FactorSet
 from number_factorer.Classical_Factoring.shor_aux.splitter import splitter
+from number_factorer.Classical_Factoring.shor_aux.concurrent_splitting import concurrent_split
+from number_factorer.Orchestration.budget import BudgetExhausted
 
-def shor_factorizer(number: int, order_finder):
+def shor_factorizer(number: int, order_finder, bases_per_call: int = 1, prefactor=None,
+                    workers: int = 1, use_threads: bool = False, budget=None):
     """
     Takes an integer number and produces a list [(p_1, a_1), ... , (p_k, a_k)]
     where p_1,...,p_k are the distinct prime factors of number and a_1,...,a_k
     are their multiplicities. 
 
     Works by repeatedly calling on an order finding algorithm to split number
-    into increasingly smaller factors.
+    into increasingly smaller factors. Each splitting attempt hands bases_per_call
+    random bases to the order finding algorithm at once.
+
+    If prefactor is given, it is called on number and budget first and must return a pair
+    (prime_list, composite_list) as produced by prefactorizer. Only the composites
+    are then split with the order finding algorithm.
+
+    With workers other than 1, the composite factors are split concurrently on a
+    pool of that many processes (all cores if None), or threads if use_threads is
+    True, and each new composite is scheduled as soon as it is found.
+
+    If a FactoringBudget is given as budget, it is checked before every splitting
+    attempt, and by the classical order finders while they search. Once it runs
+    out, the factors found so far are returned and may include composites.
     """
     # initialize empty lists for the prime factors and remaining factors
     prime_list = []
     factor_list = []
 
+    # remove small and easy factors classically
+    if prefactor is not None:
+        prime_list, factor_list = prefactor(number, budget)
+
     # remove powers of 2
-    if (number % 2) == 0:
+    elif (number % 2) == 0:
 
         k = 0
         m = number 
@@ -36,39 +54,31 @@ def shor_factorizer(number: int, order_finder):
     else:
         factor_list.append((number, 1))
     
-    # continually remove prime factors from factor_list until it is reduced to zero length
-    while len(factor_list) > 0:
+    # record each factor once, testing primality and perfect powers as it enters the set
+    factors = FactorSet(prime_list + factor_list)
 
-        # initialize empty list to record splittings of factors
-        new_list = []
+    if workers != 1:
+        concurrent_split(factors, order_finder, bases_per_call, workers, use_threads, budget)
 
-        for a in factor_list:
+    # continually split the composite factors until only primes remain
+    while not factors.complete():
 
-            # apply classical (probabalistic) primality test to each element of the factor list
-            if gmpy2.is_prime(a[0]):
+        for a in factors.composites():
 
-                prime_list.append(a)
-                continue
-
-            # apply classical perfect power test to refine factor list
-            elif gmpy2.is_power(a[0]):
-
-                b = kroot(a[0])
-                b[1] = b[1] * a[1]
-                new_list.append(tuple(b))
+            # stop with a partial factorization once the budget has run out
+            if budget is not None and budget.exhausted():
+                return [(int(factor[0]), factor[1]) for factor in factors.pairs()]
 
             # apply Shor's splitting algorithm to each remaining factor
             # splits factor a into two integers x, y with x * y == a
-            else:
-                x, y = splitter(a[0], order_finder)
-                new_list.extend([(x, a[1]), (y, a[1])])
+            try:
+                split = splitter(a, order_finder, bases_per_call)
+            except BudgetExhausted:
+                return [(int(factor[0]), factor[1]) for factor in factors.pairs()]
 
-        # update the factor list, combining repeated factors
-        factor_list = consolidate_pairs(new_list)
-
-    # run a consolidation to list of prime factors so each prime appears only once
-    final_list = consolidate_pairs(prime_list)
+            # splitter gives up after 10 unlucky rounds, a is tried again on the next pass
+            if split is not None:
+                factors.split(split[0])
 
     # convert each prime factor from mpz to int type
-    return [(int(factor[0]), factor[1]) for factor in final_list]
-
+    return [(int(factor[0]), factor[1]) for factor in factors.pairs()]
@@ -1,22 +1,30 @@
+import asyncio
+import concurrent.futures
 from abc import ABC, abstractmethod
+import gmpy2
 from typing import List, Tuple
 
 #Classical processing for factorization
 from number_factorer.Classical_Factoring.ekera_factorizer import ekera_factorizer
 from number_factorer.Classical_Factoring.shor_factorizer import shor_factorizer
+from number_factorer.Classical_Factoring.prefactorizer import prefactorizer
 
 # Classical and quantum ordering finding methods
-from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order
-from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder
-from number_factorer.Order_Finding.Quantum.beauregard_circuit import beauregard_circuit
-from number_factorer.Order_Finding.Quantum.shor_circuit import shor_circuit
-from number_factorer.Order_Finding.Quantum.quantum_order_finder import quantum_order_finder
-
-# Benchmarking methods
-from number_factorer.Bench_Marking.shor_factor_estimate import shor_estimate_time
-from number_factorer.Bench_Marking.ekera_factor_estimate import ekera_estimate_time
-
-
+from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order, baby_step_bound, DICT_ENTRY_BYTES
+from number_factorer.Order_Finding.Classical.parallel_babygiantsteps import parallel_baby_giant_order, SHARED_ENTRY_BYTES
+from number_factorer.Order_Finding.Classical.disk_babygiantsteps import disk_baby_giant_order, RUN_SIZE, RUN_ENTRY_BYTES
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder, batch_order_finder, VECTOR_MODULUS_BOUND, BATCH_THRESHOLD
+from number_factorer.Order_Finding.Classical.rho_order import rho_order
+from number_factorer.Order_Finding.order_cache import OrderCache, find_orders_sharing_multiples
+
+# Batch factoring
+from number_factorer.Orchestration.batch_factoring import factor_many
+from number_factorer.Orchestration.factor_store import FactorStore, cached_factor
+from number_factorer.Orchestration.budget import FactoringBudget, BudgetExhausted
+from number_factorer.Orchestration.async_executor import shared_executor
+
+# The quantum order finders and the benchmarking methods need Qiskit, which is
+# slow to import, so they are imported where they are first used
 
 ################################################
 ########### ORDER FINDING METHODS ##############
@@ -30,6 +38,42 @@ class OrderFindingAlgorithm(ABC):
            base with given modulus."""
         pass
 
+    def find_orders(self, bases: List[int], modulus: int) -> List[int]:
+        """
+        Returns the list of orders of each of bases with the given modulus.
+        Order finding methods override this when several bases can share work.
+        """
+        return [self.find_order(base, modulus) for base in bases]
+
+    def find_order_budgeted(self, base: int, modulus: int, budget: FactoringBudget) -> int:
+        """
+        Version of find_order that gives up by raising BudgetExhausted once budget
+        expires. The default only checks budget before calling find_order. The
+        classical methods override this to also check it while they search, so that a
+        deadline or a cancel stops a long search part way.
+        """
+        budget.check()
+
+        return self.find_order(base, modulus)
+
+    async def find_order_async(self, base: int, modulus: int, executor=None) -> int:
+        """
+        Coroutine version of find_order. The default runs find_order_budgeted on
+        executor, or the shared executor if None, so it does not block the event loop.
+        Cancelling it cancels the budget of the call, so a classical search stops at
+        its next check and frees its thread. Quantum methods override this to await
+        their simulator jobs.
+        """
+        loop = asyncio.get_running_loop()
+        budget = FactoringBudget()
+
+        try:
+            return await loop.run_in_executor(executor or shared_executor(), self.find_order_budgeted, base, modulus, budget)
+
+        except asyncio.CancelledError:
+            budget.cancel()
+            raise
+
     def is_quantum(self) -> bool:
         """
         Returns True if order finding method is based on a quantum circuit,
@@ -58,54 +102,512 @@ class IncrementOrder(OrderFindingAlgorithm):
         """
         
         return bad_order_finder(invertible, modulus)
+
+    def find_order_budgeted(self, invertible: int, modulus: int, budget: FactoringBudget) -> int:
+
+        return bad_order_finder(invertible, modulus, budget)
+
+    def find_order_batch(self, invertibles, moduli) -> list:
+        """
+        Computes the orders of many (invertible, modulus) pairs in one call. moduli is
+        either a list matching invertibles or a single modulus. When there are at least
+        BATCH_THRESHOLD pairs with moduli below 2 ** 31, those are advanced together as
+        NumPy arrays; every other pair is done one at a time, which is faster for
+        fewer pairs. Non-invertible entries give None, as in find_order.
+        """
+        invertibles = list(invertibles)
+
+        if not hasattr(moduli, '__iter__'):
+            moduli = [moduli] * len(invertibles)
+        else:
+            moduli = list(moduli)
+
+        small = [i for i, m in enumerate(moduli) if 1 <= m < VECTOR_MODULUS_BOUND]
+
+        if len(small) < BATCH_THRESHOLD:
+            small = []
+
+        small_orders = batch_order_finder([invertibles[i] for i in small], [moduli[i] for i in small])
+
+        orders = [None] * len(invertibles)
+
+        for i, order in zip(small, small_orders):
+            orders[i] = int(order) if order else None
+
+        small = set(small)
+        for i in range(len(invertibles)):
+            if i not in small:
+                orders[i] = bad_order_finder(invertibles[i], moduli[i])
+
+        return orders
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        """
+        Orders found for earlier bases are combined into a common multiple, and later
+        bases whose order divides it are answered without a new search. With a single
+        modulus this is faster than find_order_batch for any number of bases.
+        """
+
+        return find_orders_sharing_multiples(self.find_order, invertibles, modulus)
     
 class BabyGiantOrder(OrderFindingAlgorithm):
+    def __init__(self, workers: int = 1, on_disk: bool = False, table_dir: str = None,
+                 max_table_entries: int = None, memory_budget: int = None):
+        """
+        workers is the number of processes used to search. With workers > 1 (or None
+        for all cores) the baby-step table is kept in shared memory and giant steps are
+        scanned in parallel, for moduli below 2 ** 64 large enough to benefit.
+
+        With on_disk=True the baby-step table is instead written to a memory-mapped
+        file in table_dir (the system temporary directory if None) and probed through
+        the page cache, trading RAM for local disk. This search runs in one process.
+
+        max_table_entries caps the number of stored baby steps and memory_budget caps
+        the bytes of RAM used by the table. When either is below sqrt(modulus) the
+        search takes more giant steps with a smaller table, and still returns the exact
+        order. Use expected_memory to see the cost for a given modulus up front.
+        """
+        self.workers = workers
+        self.on_disk = on_disk
+        self.table_dir = table_dir
+        self.max_table_entries = max_table_entries
+        self.memory_budget = memory_budget
+
+    def table_entries(self, modulus: int) -> int:
+        """
+        Returns the number of baby steps stored when finding orders modulo modulus.
+        """
+        max_entries = self.max_table_entries
+
+        # a disk-backed table only costs RAM while a run is sorted
+        if self.memory_budget is not None and not self.on_disk:
+            entry_bytes = DICT_ENTRY_BYTES if self.workers == 1 else SHARED_ENTRY_BYTES
+            budget_entries = max(1, self.memory_budget // entry_bytes)
+
+            max_entries = budget_entries if max_entries is None else min(max_entries, budget_entries)
+
+        return baby_step_bound(modulus, max_entries)
+
+    def expected_memory(self, modulus: int) -> int:
+        """
+        Returns the number of bytes of RAM the baby-step table is expected to use when
+        finding orders modulo modulus. A disk-backed table additionally uses 16 bytes
+        of disk per entry.
+        """
+        entries = self.table_entries(modulus)
+
+        if self.on_disk:
+            return min(entries, self._run_size()) * RUN_ENTRY_BYTES
+
+        if self.workers != 1:
+            return entries * SHARED_ENTRY_BYTES
+
+        return entries * DICT_ENTRY_BYTES
+
+    def _run_size(self) -> int:
+        if self.memory_budget is None:
+            return RUN_SIZE
+
+        return max(1, min(RUN_SIZE, self.memory_budget // RUN_ENTRY_BYTES))
+
     def find_order(self, invertible: int, modulus: int) -> int:
         """
         Finds the order of an invertible element in (Z/modulus * Z)^* using Baby Steps, Giant Steps
         algorithm due to Shanks.
         """
-        
-        return baby_giant_order(invertible, modulus)
+
+        return self.find_order_budgeted(invertible, modulus, None)
+
+    def find_order_budgeted(self, invertible: int, modulus: int, budget: FactoringBudget) -> int:
+        max_entries = self.table_entries(modulus)
+
+        if self.on_disk:
+            return disk_baby_giant_order(invertible, modulus, self.table_dir, max_entries, self._run_size(), budget)
+
+        if self.workers != 1:
+            return parallel_baby_giant_order(invertible, modulus, self.workers, max_entries, budget)
+
+        return baby_giant_order(invertible, modulus, max_entries, budget)
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        """
+        Orders found for earlier bases are combined into a common multiple, and later
+        bases whose order divides it are answered without a new search.
+        """
+
+        return find_orders_sharing_multiples(self.find_order, invertibles, modulus)
+
+class RhoOrder(OrderFindingAlgorithm):
+    def find_order(self, invertible: int, modulus: int) -> int:
+        """
+        Finds the order of an invertible element in (Z/modulus * Z)^* using a Pollard rho
+        random walk with Brent's cycle detection. Runs in O(sqrt(order)) time like
+        Baby Steps, Giant Steps, but with constant memory.
+        """
+
+        return rho_order(invertible, modulus)
+
+    def find_order_budgeted(self, invertible: int, modulus: int, budget: FactoringBudget) -> int:
+
+        return rho_order(invertible, modulus, budget=budget)
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        """
+        Orders found for earlier bases are combined into a common multiple, and later
+        bases whose order divides it are answered without a new walk.
+        """
+
+        return find_orders_sharing_multiples(self.find_order, invertibles, modulus)
 
 #############
 ## Quantum ##
 #############
 
 class ShorOrder(OrderFindingAlgorithm):
+    def __init__(self, shots: int = 64):
+        """
+        Each simulator job takes shots measurements, which are tried from most to
+        least frequent; another job is only run if none of them gives the order.
+        """
+        self.shots = shots
+
     def find_order(self, invertible: int, modulus: int) -> int:
-        
-        return quantum_order_finder(invertible, modulus, shor_circuit, 'shor')
+        from number_factorer.Order_Finding.Quantum.quantum_order_finder import quantum_order_finder
+        from number_factorer.Order_Finding.Quantum.shor_circuit import shor_circuit
+
+        return quantum_order_finder(invertible, modulus, shor_circuit, 'shor', self.shots)
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        """
+        Simulates the circuits for all invertibles as a single Aer job.
+        """
+        from number_factorer.Order_Finding.Quantum.quantum_order_finder import quantum_order_finder_batch
+        from number_factorer.Order_Finding.Quantum.shor_circuit import shor_circuit
+
+        return quantum_order_finder_batch(invertibles, modulus, shor_circuit, 'shor', self.shots)
+
+    async def find_order_async(self, invertible: int, modulus: int, executor=None) -> int:
+        """
+        Transpiles on executor, or the circuit executor if None, and awaits each
+        simulator job. Cancelling the coroutine stops before the next job; see
+        await_job for a job already running.
+        """
+        from number_factorer.Order_Finding.Quantum.quantum_order_finder import quantum_order_finder_async
+        from number_factorer.Order_Finding.Quantum.shor_circuit import shor_circuit
+
+        return await quantum_order_finder_async(invertible, modulus, shor_circuit, 'shor', self.shots, executor)
     
     def is_quantum(self):
         return True
     
     def get_circuit(self, invertible, modulus):
+        from number_factorer.Order_Finding.Quantum.shor_circuit import shor_circuit
+
         nbits = modulus.bit_length()
 
         return shor_circuit(invertible, modulus, nbits)
 
 class BeauregardOrder(OrderFindingAlgorithm):
+    def __init__(self, shots: int = 64):
+        """
+        Each simulator job takes shots measurements, which are tried from most to
+        least frequent; another job is only run if none of them gives the order.
+        """
+        self.shots = shots
+
     def find_order(self, invertible: int, modulus: int) -> int:
-        
-        return quantum_order_finder(invertible, modulus, beauregard_circuit, 'beau')
+        from number_factorer.Order_Finding.Quantum.quantum_order_finder import quantum_order_finder
+        from number_factorer.Order_Finding.Quantum.beauregard_circuit import beauregard_circuit
+
+        return quantum_order_finder(invertible, modulus, beauregard_circuit, 'beau', self.shots)
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        """
+        Simulates the circuits for all invertibles as a single Aer job.
+        """
+        from number_factorer.Order_Finding.Quantum.quantum_order_finder import quantum_order_finder_batch
+        from number_factorer.Order_Finding.Quantum.beauregard_circuit import beauregard_circuit
+
+        return quantum_order_finder_batch(invertibles, modulus, beauregard_circuit, 'beau', self.shots)
+
+    async def find_order_async(self, invertible: int, modulus: int, executor=None) -> int:
+        """
+        Transpiles on executor, or the circuit executor if None, and awaits each
+        simulator job. Cancelling the coroutine stops before the next job; see
+        await_job for a job already running.
+        """
+        from number_factorer.Order_Finding.Quantum.quantum_order_finder import quantum_order_finder_async
+        from number_factorer.Order_Finding.Quantum.beauregard_circuit import beauregard_circuit
+
+        return await quantum_order_finder_async(invertible, modulus, beauregard_circuit, 'beau', self.shots, executor)
     
     def is_quantum(self):
         return True
     
     def get_circuit(self, invertible, modulus):
+        from number_factorer.Order_Finding.Quantum.beauregard_circuit import beauregard_circuit
+
         nbits = modulus.bit_length()
 
         return beauregard_circuit(invertible, modulus, nbits)
 
+#############
+## Caching ##
+#############
+
+class CachedOrder(OrderFindingAlgorithm):
+    def __init__(self, order_finder: OrderFindingAlgorithm, maxsize: int = 1024):
+        """
+        Wraps an order finding algorithm with a least-recently-used cache of up to
+        maxsize orders. Repeated (base, modulus) queries are answered from the cache,
+        and bases whose order divides the lcm of the known orders for the modulus
+        are answered by reducing that lcm instead of calling order_finder.
+        """
+        self.order_finder = order_finder
+        self.cache = OrderCache(maxsize)
+
+    def find_order(self, invertible: int, modulus: int) -> int:
+        order = self.cache.lookup(invertible, modulus)
+
+        if order is None:
+            order = self.order_finder.find_order(invertible, modulus)
+
+            if order:
+                self.cache.store(invertible, modulus, order)
+
+        return order
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        orders = [self.cache.lookup(invertible, modulus) for invertible in invertibles]
+        missing = [i for i, order in enumerate(orders) if order is None]
+
+        if missing:
+            found = self.order_finder.find_orders([invertibles[i] for i in missing], modulus)
+
+            for i, order in zip(missing, found):
+                orders[i] = order
+
+                if order:
+                    self.cache.store(invertibles[i], modulus, order)
+
+        return orders
+
+    def find_order_budgeted(self, invertible: int, modulus: int, budget: FactoringBudget) -> int:
+        order = self.cache.lookup(invertible, modulus)
+
+        if order is None:
+            order = self.order_finder.find_order_budgeted(invertible, modulus, budget)
+
+            if order:
+                self.cache.store(invertible, modulus, order)
+
+        return order
+
+    async def find_order_async(self, invertible: int, modulus: int, executor=None) -> int:
+        order = self.cache.lookup(invertible, modulus)
+
+        if order is None:
+            order = await self.order_finder.find_order_async(invertible, modulus, executor)
+
+            if order:
+                self.cache.store(invertible, modulus, order)
+
+        return order
+
+    def find_power_order(self, invertible: int, exponent: int, modulus: int) -> int:
+        """
+        Returns the order of invertible ** exponent modulo modulus, computed as
+        ord(invertible) / gcd(exponent, ord(invertible)).
+        """
+        order = self.cache.power_order(invertible, exponent, modulus)
+
+        if order is None:
+            self.find_order(invertible, modulus)
+            order = self.cache.power_order(invertible, exponent, modulus)
+
+        return order
+
+    def is_quantum(self):
+        return self.order_finder.is_quantum()
+
+    def get_circuit(self, invertible, modulus):
+        return self.order_finder.get_circuit(invertible, modulus)
+
+class BudgetedOrder(OrderFindingAlgorithm):
+    def __init__(self, order_finder: OrderFindingAlgorithm, budget: FactoringBudget):
+        """
+        Wraps an order finding algorithm so that each base it is asked about is charged
+        to budget. Raises BudgetExhausted instead of calling order_finder once the
+        budget has run out, and classical searches already running raise it as soon as
+        the budget expires.
+        """
+        self.order_finder = order_finder
+        self.budget = budget
+
+    def find_order(self, invertible: int, modulus: int) -> int:
+        self.budget.charge()
+
+        return self.order_finder.find_order_budgeted(invertible, modulus, self.budget)
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        self.budget.charge(len(invertibles))
+
+        if self.order_finder.is_quantum():
+            return self.order_finder.find_orders(invertibles, modulus)
+
+        # classical searches are run one at a time so that each is checked against the budget
+        find_order = lambda invertible, modulus: self.order_finder.find_order_budgeted(invertible, modulus, self.budget)
+
+        return find_orders_sharing_multiples(find_order, invertibles, modulus)
+
+    async def find_order_async(self, invertible: int, modulus: int, executor=None) -> int:
+        self.budget.charge()
+
+        return await self.order_finder.find_order_async(invertible, modulus, executor)
+
+    def is_quantum(self):
+        return self.order_finder.is_quantum()
+
+    def get_circuit(self, invertible, modulus):
+        return self.order_finder.get_circuit(invertible, modulus)
+
+class EventLoopOrder(OrderFindingAlgorithm):
+    def __init__(self, order_finder: OrderFindingAlgorithm, loop):
+        """
+        Lets code running in a worker thread call the coroutine find_order_async of
+        order_finder on the event loop loop, waiting for its result. Calls in flight
+        can be cancelled from the loop with cancel, which makes them raise
+        BudgetExhausted in the waiting thread.
+        """
+        self.order_finder = order_finder
+        self.loop = loop
+        self.in_flight = set()
+
+    def find_order(self, invertible: int, modulus: int) -> int:
+        future = asyncio.run_coroutine_threadsafe(self.order_finder.find_order_async(invertible, modulus), self.loop)
+        self.in_flight.add(future)
+
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            raise BudgetExhausted
+        finally:
+            self.in_flight.discard(future)
+
+    def cancel(self):
+        for future in list(self.in_flight):
+            future.cancel()
+
+    def is_quantum(self):
+        return self.order_finder.is_quantum()
+
+    def get_circuit(self, invertible, modulus):
+        return self.order_finder.get_circuit(invertible, modulus)
+
+class StoredOrder(OrderFindingAlgorithm):
+    def __init__(self, order_finder: OrderFindingAlgorithm, store: FactorStore):
+        """
+        Wraps an order finding algorithm so that its results are kept in, and read
+        back from, the persistent FactorStore store.
+        """
+        self.order_finder = order_finder
+        self.store = store
+
+    def find_order(self, invertible: int, modulus: int) -> int:
+        order = self.store.lookup_order(invertible, modulus)
+
+        if order is None:
+            order = self.order_finder.find_order(invertible, modulus)
+
+            if order:
+                self.store.store_order(invertible, modulus, order)
+
+        return order
+
+    def find_orders(self, invertibles: List[int], modulus: int) -> List[int]:
+        orders = [self.store.lookup_order(invertible, modulus) for invertible in invertibles]
+        missing = [i for i, order in enumerate(orders) if order is None]
+
+        if missing:
+            found = self.order_finder.find_orders([invertibles[i] for i in missing], modulus)
+
+            for i, order in zip(missing, found):
+                orders[i] = order
+
+                if order:
+                    self.store.store_order(invertibles[i], modulus, order)
+
+        return orders
+
+    def find_order_budgeted(self, invertible: int, modulus: int, budget: FactoringBudget) -> int:
+        order = self.store.lookup_order(invertible, modulus)
+
+        if order is None:
+            order = self.order_finder.find_order_budgeted(invertible, modulus, budget)
+
+            if order:
+                self.store.store_order(invertible, modulus, order)
+
+        return order
+
+    async def find_order_async(self, invertible: int, modulus: int, executor=None) -> int:
+        order = self.store.lookup_order(invertible, modulus)
+
+        if order is None:
+            order = await self.order_finder.find_order_async(invertible, modulus, executor)
+
+            if order:
+                self.store.store_order(invertible, modulus, order)
+
+        return order
+
+    def is_quantum(self):
+        return self.order_finder.is_quantum()
+
+    def get_circuit(self, invertible, modulus):
+        return self.order_finder.get_circuit(invertible, modulus)
+
 
 ################################################
 ############ CLASSICAL PROCESSING ##############
 ################################################
 
+class PreFactorization:
+    def __init__(self, trial_bound: int = 2 ** 16, rho_iterations: int = 2 ** 14, pm1_bound: int = 10 ** 4,
+                 ecm_curves: int = 8, ecm_bound: int = 2000):
+        """
+        A cheap classical stage run before order finding. Removes primes below trial_bound
+        by trial division, then splits the remaining cofactor with Pollard's rho (up to
+        rho_iterations steps), Pollard's p - 1 (smoothness bound pm1_bound) and the
+        elliptic curve method (ecm_curves curves with bound ecm_bound). Set a budget to 0
+        to skip that method.
+
+        The stage stops early, leaving the factors it has not split as composites, once
+        the FactoringBudget of the factorization expires.
+        """
+        self.trial_bound = trial_bound
+        self.rho_iterations = rho_iterations
+        self.pm1_bound = pm1_bound
+        self.ecm_curves = ecm_curves
+        self.ecm_bound = ecm_bound
+
+    def reduce(self, number: int, budget: FactoringBudget = None):
+        """
+        Returns (prime_list, composite_list), lists of pairs (a, n) whose combined product
+        of a ** n is number. The composites are those left for order finding.
+        """
+        return prefactorizer(number, self.trial_bound, self.rho_iterations, self.pm1_bound,
+                             self.ecm_curves, self.ecm_bound, budget)
+
 class FactorizationAlgorithm(ABC):
     @abstractmethod
-    def factor(self, number: int, order_finder: OrderFindingAlgorithm) -> List[Tuple[int, int]]:
+    def factor(self, number: int, order_finder: OrderFindingAlgorithm, budget: FactoringBudget = None) -> List[Tuple[int, int]]:
+        """
+        Returns the prime factorization [(p_1, n_1), ..., (p_k, n_k)] of number, using
+        order_finder to split it. If a FactoringBudget is given as budget, the
+        factorization stops once it runs out and returns the factors found so far, some
+        of which may then be composite.
+        """
         pass
 
     def quantum_time_estimate(self, number: int, order_finder: OrderFindingAlgorithm) -> float:
@@ -116,15 +618,37 @@ class FactorizationAlgorithm(ABC):
 #############
 
 class ShorFactorization(FactorizationAlgorithm):
+    def __init__(self, bases_per_call: int = 1, prefactor: PreFactorization = None,
+                 workers: int = 1, use_threads: bool = False):
+        """
+        bases_per_call is the number of random bases tried at once when splitting a
+        factor. With more than one, the order finder's find_orders is called on all
+        of them together and the first base that splits the factor is used.
 
-    def factor(self, number: int, order_finder: OrderFindingAlgorithm) -> List[Tuple[int, int]]:
+        If a PreFactorization is given as prefactor, its cheap classical methods are run
+        first and only the cofactors they cannot split are sent to the order finder.
+
+        With workers other than 1, independent composite factors are split concurrently
+        on a pool of that many processes (all cores if None), or threads if use_threads
+        is True.
+        """
+        self.bases_per_call = bases_per_call
+        self.prefactor = prefactor
+        self.workers = workers
+        self.use_threads = use_threads
+
+    def factor(self, number: int, order_finder: OrderFindingAlgorithm, budget: FactoringBudget = None) -> List[Tuple[int, int]]:
         """
         The full factorization algorithm hinted at by Shor in REFERENCE. Takes an integer number
         and provides its full prime factorization in  the form 
         [(p_1, n_1), ..., (p_k, n_k)] where p_i are distinct primes and
         (p_1 ** n_1) * ... * (p_k ** n_k) = number
+
+        If budget runs out first, some p_i may be composite.
         """
-        return shor_factorizer(number, order_finder)
+        prefactor = self.prefactor.reduce if self.prefactor is not None else None
+
+        return shor_factorizer(number, order_finder, self.bases_per_call, prefactor, self.workers, self.use_threads, budget)
     
     def quantum_time_estimate(self, number: int, quantum_order_name):
         """
@@ -133,6 +657,8 @@ class ShorFactorization(FactorizationAlgorithm):
         'shor' or 'beau'
         """
 
+        from number_factorer.Bench_Marking.shor_factor_estimate import shor_estimate_time
+
         return shor_estimate_time(number, quantum_order_name)
 
     
@@ -142,18 +668,30 @@ class ShorFactorization(FactorizationAlgorithm):
 #############
     
 class EkeraFactorization(FactorizationAlgorithm):
-    def __init__(self):
-        self.smallprimeslist = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223, 227, 229, 233, 239, 241, 251, 257, 263, 269, 271, 277, 281, 283, 293, 307, 311, 313, 317, 331, 337, 347, 349, 353, 359, 367, 373, 379, 383, 389, 397, 401, 409, 419, 421, 431, 433, 439, 443, 449, 457, 461, 463, 467, 479, 487, 491, 499, 503, 509, 521, 523, 541]
+    def __init__(self, prefactor: PreFactorization = None, workers: int = 1):
+        """
+        If a PreFactorization is given as prefactor, its cheap classical methods are run
+        first and the order finding algorithm is only called on the cofactors they cannot
+        split. With workers other than 1, the independent factoring rounds that follow the
+        order finding call run on a pool of that many processes (all cores if None).
+        """
+        self.prefactor = prefactor
+        self.workers = workers
 
 
-    def factor(self, number: int, order_finder: OrderFindingAlgorithm, bit_cutoff: int = 2, factoring_rounds: int = 40) -> List[Tuple[int, int]]:
+    def factor(self, number: int, order_finder: OrderFindingAlgorithm, bit_cutoff: int = 2, factoring_rounds: int = 40,
+               budget: FactoringBudget = None) -> List[Tuple[int, int]]:
         """
         Factors number with one call to an order finding algorithm. An implementation
         of the algorithm found in "On completely factoring any integer efficiently in 
         a single run of an order-finding algorithm" by Martin Ekera
+
+        If budget runs out first, some of the factors returned may be composite.
         """
         
-        return ekera_factorizer(number, order_finder, bit_cutoff, factoring_rounds)
+        prefactor = self.prefactor.reduce if self.prefactor is not None else None
+
+        return ekera_factorizer(number, order_finder, bit_cutoff, factoring_rounds, prefactor, self.workers, budget)
     
     def quantum_time_estimate(self, number: int, quantum_order_name):
         """
@@ -162,6 +700,8 @@ class EkeraFactorization(FactorizationAlgorithm):
         'shor' or 'beau'
         """
 
+        from number_factorer.Bench_Marking.ekera_factor_estimate import ekera_estimate_time
+
         return ekera_estimate_time(number, quantum_order_name)
 
 
@@ -170,17 +710,108 @@ class EkeraFactorization(FactorizationAlgorithm):
 ################################################
 
 class Number_Factorer:
-    def __init__(self, factor_algo: FactorizationAlgorithm, order_algo: OrderFindingAlgorithm):
+    def __init__(self, factor_algo: FactorizationAlgorithm, order_algo: OrderFindingAlgorithm,
+                 cache_path: str = None, max_cache_entries: int = 100000):
+        """
+        If cache_path is given, factor keeps factorizations, divisors and orders in a
+        SQLite file there, with at most max_cache_entries of each, evicting the least
+        recently used. Cached factorizations are returned directly, and cached divisors
+        of a new number split it before the factorization algorithm is called on what
+        is left.
+        """
         self.factor_algo = factor_algo
         self.order_algo = order_algo
+        self.store = FactorStore(cache_path, max_cache_entries) if cache_path is not None else None
 
     def factor(self, number: int) -> List[Tuple[int, int]]:
-        return self.factor_algo.factor(number, self.order_algo)
+        """
+        Returns the prime factorization [(p_1, n_1), ..., (p_k, n_k)] of number.
+        """
+        return self._factor(number, self.order_algo)
+
+    def factor_partial(self, number: int, deadline: float = None, max_order_calls: int = None) -> List[Tuple[int, int, bool]]:
+        """
+        Factors number until deadline (in seconds) or max_order_calls calls to the order
+        finding algorithm run out, whichever is first, and returns what has been found
+        as triples [(a_1, n_1, is_prime_1), ..., (a_k, n_k, is_prime_k)], where
+        is_prime_i says whether a_i is prime. Either limit may be None.
+        """
+        budget = FactoringBudget(deadline, max_order_calls)
+        factors = self._factor(number, BudgetedOrder(self.order_algo, budget), budget)
+
+        return [(a, n, bool(gmpy2.is_prime(a))) for a, n in factors]
+
+    async def factor_async(self, number: int, executor=None) -> List[Tuple[int, int]]:
+        """
+        Coroutine version of factor. The factorization runs on executor, or the shared
+        executor if None, while the event loop stays free. Calls to a quantum order
+        finding algorithm are made on the event loop, awaiting the simulator jobs.
+
+        Cancelling the coroutine cancels the budget of the factorization. A classical
+        order finding search in flight stops at its next check, within a few thousand
+        steps, and the worker thread is freed. A quantum simulator job that has not
+        started is cancelled, but one that is already running cannot be interrupted;
+        it finishes in the background and its result is discarded.
+        """
+        return await self._factor_async(number, FactoringBudget(), executor)
+
+    async def factor_partial_async(self, number: int, deadline: float = None, max_order_calls: int = None,
+                                   executor=None) -> List[Tuple[int, int, bool]]:
+        """
+        Coroutine version of factor_partial, run and cancelled like factor_async.
+        """
+        factors = await self._factor_async(number, FactoringBudget(deadline, max_order_calls), executor)
+
+        return [(a, n, bool(gmpy2.is_prime(a))) for a, n in factors]
+
+    async def _factor_async(self, number: int, budget: FactoringBudget, executor=None):
+        loop = asyncio.get_running_loop()
+
+        loop_order = EventLoopOrder(self.order_algo, loop) if self.order_algo.is_quantum() else None
+        order_algo = BudgetedOrder(loop_order or self.order_algo, budget)
+
+        try:
+            factors = await loop.run_in_executor(executor or shared_executor(), self._factor, number, order_algo, budget)
+
+        except asyncio.CancelledError:
+            budget.cancel()
+
+            if loop_order is not None:
+                loop_order.cancel()
+
+            raise
+
+        return factors
+
+    def _factor(self, number: int, order_algo: OrderFindingAlgorithm, budget: FactoringBudget = None):
+        if self.store is not None:
+            return cached_factor(self.factor_algo, StoredOrder(order_algo, self.store), self.store, number, budget)
+
+        if budget is None:
+            return self.factor_algo.factor(number, order_algo)
+
+        return self.factor_algo.factor(number, order_algo, budget=budget)
+
+    def factor_many(self, numbers, workers: int = None, chunksize: int = 16, ordered: bool = False):
+        """
+        Factors every integer in the iterable numbers on a pool of workers processes
+        (all cores if None), each reusing this factorer's factor_algo and order_algo.
+        Yields (number, factorization) pairs as they finish, or in input order if
+        ordered is True. Numbers are handed out chunksize at a time and only a bounded
+        number of chunks is in flight, so numbers may be an unbounded stream.
+        """
+        return factor_many(self.factor_algo, self.order_algo, numbers, workers, chunksize, ordered)
     
     def quantum_time_estimate(self, number: int) -> float:
 
         if self.order_algo.is_quantum():
-            algo_name = self.order_algo.__class__.__name__
+            order_algo = self.order_algo
+
+            # report the wrapped algorithm for cached order finders
+            if isinstance(order_algo, CachedOrder):
+                order_algo = order_algo.order_finder
+
+            algo_name = order_algo.__class__.__name__
 
             return self.factor_algo.quantum_time_estimate(number, algo_name)
         
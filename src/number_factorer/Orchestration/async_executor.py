@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import threading
+
+"""
+The executor that the asyncio API offloads blocking factoring and order finding
+work to. It is created on first use and shared by the whole process, so any
+number of concurrent coroutines runs on a fixed number of threads.
+
+Work that the event loop offloads on behalf of a factorization, such as building
+and transpiling the circuit of a quantum order finding call, goes to a separate
+circuit executor instead. The factorization itself holds a thread of the shared
+executor while it waits for that call, so if both used the same pool, enough
+concurrent factorizations would take every thread and the calls could never run.
+"""
+
+# threads in the shared executor unless set_max_workers is called first
+MAX_WORKERS = min(32, multiprocessing.cpu_count() + 4)
+
+# threads in the circuit executor
+CIRCUIT_WORKERS = min(8, multiprocessing.cpu_count())
+
+_lock = threading.Lock()
+_executor = None
+_circuit_executor = None
+_max_workers = MAX_WORKERS
+
+def shared_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide executor, creating it on first use.
+    """
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix='number_factorer')
+
+        return _executor
+
+def circuit_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide executor for circuit construction and transpiling,
+    creating it on first use. Nothing run on it waits for other offloaded work.
+    """
+    global _circuit_executor
+
+    with _lock:
+        if _circuit_executor is None:
+            _circuit_executor = ThreadPoolExecutor(max_workers=CIRCUIT_WORKERS, thread_name_prefix='number_factorer_circuits')
+
+        return _circuit_executor
+
+def set_max_workers(max_workers: int):
+    """
+    Sets the size of the shared executor. An executor already created is shut down
+    once its running work finishes, and a new one of the given size replaces it.
+    """
+    global _executor, _max_workers
+
+    with _lock:
+        _max_workers = max_workers
+
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
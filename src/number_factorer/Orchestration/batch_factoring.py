@@ -0,0 +1,67 @@
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+
+"""
+Factoring a stream of integers on a pool of processes. Each worker receives the
+factorization and order finding algorithms once, when it starts, and then
+factors chunks of numbers. Only a bounded number of chunks is in flight at any
+time, so an unbounded input stream never piles up in memory.
+"""
+
+_algorithms = None
+
+def _init_worker(factor_algo, order_algo):
+    """
+    Pool initializer: keeps the algorithms for the lifetime of the worker.
+    """
+    global _algorithms
+
+    _algorithms = (factor_algo, order_algo)
+
+def _factor_chunk(numbers):
+    factor_algo, order_algo = _algorithms
+
+    return [(number, factor_algo.factor(number, order_algo)) for number in numbers]
+
+def factor_many(factor_algo, order_algo, numbers, workers: int = None, chunksize: int = 16,
+                ordered: bool = False, max_pending: int = None):
+    """
+    Generator yielding (number, factorization) for each integer in the iterable
+    numbers, factored by factor_algo with order_algo on workers processes (all cores
+    if None). Numbers are sent to workers chunksize at a time, and at most
+    max_pending chunks (twice the number of workers by default) are queued or
+    running at once. Results are yielded as soon as they finish, or in input order
+    if ordered is True.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    max_pending = max_pending or 2 * workers
+
+    numbers = iter(numbers)
+    chunks = iter(lambda: list(itertools.islice(numbers, chunksize)), [])
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(factor_algo, order_algo))
+
+    try:
+        pending = deque(pool.submit(_factor_chunk, chunk) for chunk in itertools.islice(chunks, max_pending))
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    pending.remove(future)
+
+            # refill before yielding so workers stay busy while the caller consumes results
+            for chunk in itertools.islice(chunks, len(done)):
+                pending.append(pool.submit(_factor_chunk, chunk))
+
+            for future in done:
+                yield from future.result()
+
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
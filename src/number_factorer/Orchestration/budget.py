@@ -0,0 +1,75 @@
+import time
+
+"""
+Time and order finding budgets for anytime factoring. The factorizers check the
+budget between stages and before every order finding call, and return the
+factorization found so far, possibly with composite entries, once it runs out.
+Long classical searches also check it every CHECK_INTERVAL steps, so a deadline
+or a cancel stops them part way.
+"""
+
+# steps of a long search loop between two budget checks
+CHECK_INTERVAL = 1 << 12
+
+class BudgetExhausted(Exception):
+    """
+    Raised in place of an order finding call when the budget has run out.
+    """
+    pass
+
+class FactoringBudget:
+    """
+    A budget of deadline seconds from its creation and max_order_calls calls to an
+    order finding algorithm. Either limit may be None, meaning unlimited, and the
+    budget can also be cancelled outright. Deadlines
+    are kept in wall-clock time so that a copy sent to a worker process agrees with
+    the original.
+    """
+
+    def __init__(self, deadline: float = None, max_order_calls: int = None):
+        self.deadline_at = time.time() + deadline if deadline is not None else None
+        self.max_order_calls = max_order_calls
+        self.order_calls = 0
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Ends the budget at once, stopping the factorization using it at its next check.
+        """
+        self.cancelled = True
+
+    def expired(self) -> bool:
+        """
+        Returns True if the deadline has passed or the budget was cancelled. Work that
+        makes no order finding calls only needs to check this.
+        """
+        if self.cancelled:
+            return True
+
+        return self.deadline_at is not None and time.time() >= self.deadline_at
+
+    def exhausted(self) -> bool:
+        """
+        Returns True if the budget has expired or no order finding calls are left.
+        """
+        if self.expired():
+            return True
+
+        return self.max_order_calls is not None and self.order_calls >= self.max_order_calls
+
+    def check(self):
+        """
+        Raises BudgetExhausted if the budget has expired.
+        """
+        if self.expired():
+            raise BudgetExhausted
+
+    def charge(self, calls: int = 1):
+        """
+        Records calls order finding calls about to be made. Raises BudgetExhausted,
+        and records nothing, if the budget has already run out.
+        """
+        if self.exhausted():
+            raise BudgetExhausted
+
+        self.order_calls += calls
@@ -0,0 +1,224 @@
+import json
+import sqlite3
+import threading
+import time
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.factor_set import FactorSet
+from number_factorer.Classical_Factoring.common_aux.product_tree import product_tree, remainder_tree
+from number_factorer.Classical_Factoring.shor_aux.refine import consolidate_pairs
+
+"""
+A persistent cache of factoring results in a SQLite file, shared across runs and
+processes. It keeps complete factorizations, non-trivial divisors and orders
+keyed by (base, modulus); integers are stored as decimal TEXT since they do not
+fit SQLite's 64-bit INTEGER. Each table holds at most max_entries rows, and the
+least recently used rows are evicted beyond that.
+"""
+
+# below this many divisors a plain scan is cheaper than building a tree
+TREE_THRESHOLD = 16
+
+# the tables are trimmed to max_entries once every this many writes
+EVICT_EVERY = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS factorizations (number TEXT PRIMARY KEY, factors TEXT NOT NULL, last_used REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS divisors (divisor TEXT PRIMARY KEY, last_used REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS orders (base TEXT NOT NULL, modulus TEXT NOT NULL, value TEXT NOT NULL,
+                                   last_used REAL NOT NULL, PRIMARY KEY (base, modulus));
+CREATE INDEX IF NOT EXISTS factorizations_last_used ON factorizations (last_used);
+CREATE INDEX IF NOT EXISTS divisors_last_used ON divisors (last_used);
+CREATE INDEX IF NOT EXISTS orders_last_used ON orders (last_used);
+"""
+
+class FactorStore:
+    """
+    Factorizations, divisors and orders cached in the SQLite file at path, each table
+    limited to max_entries rows. The store can be used from several threads, and a
+    copy sent to another process reopens the same file.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        self.path = path
+        self.max_entries = max_entries
+        self._open()
+
+    def _open(self):
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._divisors = None
+        self._tree = None
+
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def __getstate__(self):
+        return {'path': self.path, 'max_entries': self.max_entries}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    def close(self):
+        self.connection.close()
+
+    def _write(self, statement: str, rows: list):
+        with self._lock, self.connection:
+            self.connection.executemany(statement, rows)
+            self._writes += 1
+
+            if self._writes % EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self):
+        for table in ['factorizations', 'divisors', 'orders']:
+            self.connection.execute(f'DELETE FROM {table} WHERE rowid IN '
+                                    f'(SELECT rowid FROM {table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                                    (self.max_entries,))
+
+        self._divisors = None
+        self._tree = None
+
+    def lookup_factorization(self, number: int) -> list:
+        """
+        Returns the cached factorization [(p_1, n_1), ..., (p_k, n_k)] of number, or None.
+        """
+        with self._lock:
+            row = self.connection.execute('SELECT factors FROM factorizations WHERE number = ?', (str(number),)).fetchone()
+
+            if row is None:
+                return None
+
+            with self.connection:
+                self.connection.execute('UPDATE factorizations SET last_used = ? WHERE number = ?', (time.time(), str(number)))
+
+        return [(int(p), n) for p, n in json.loads(row[0])]
+
+    def store_factorization(self, number: int, factors: list):
+        """
+        Caches the factorization of number, and its prime factors as divisors.
+        """
+        now = time.time()
+        self._write('INSERT OR REPLACE INTO factorizations VALUES (?, ?, ?)',
+                    [(str(number), json.dumps([(str(p), n) for p, n in factors]), now)])
+        self.store_divisors([p for p, _ in factors if p != number])
+
+    def store_divisors(self, divisors: list):
+        """
+        Caches non-trivial divisors of numbers being factored.
+        """
+        divisors = [int(d) for d in divisors if d > 1]
+
+        if not divisors:
+            return
+
+        now = time.time()
+        self._write('INSERT OR REPLACE INTO divisors VALUES (?, ?)', [(str(d), now) for d in divisors])
+
+        with self._lock:
+            if self._divisors is not None:
+                known = set(self._divisors)
+                self._divisors.extend(d for d in set(divisors) if d not in known)
+                self._tree = None
+
+    def dividing(self, number: int) -> list:
+        """
+        Returns the cached divisors d with 1 < d < number that divide number.
+        """
+        with self._lock:
+            if self._divisors is None:
+                self._divisors = [int(row[0]) for row in self.connection.execute('SELECT divisor FROM divisors')]
+                self._tree = None
+
+            divisors = self._divisors
+
+            if len(divisors) < TREE_THRESHOLD:
+                remainders = [number % d for d in divisors]
+            else:
+                if self._tree is None:
+                    self._tree = product_tree(divisors)
+
+                remainders = remainder_tree(number, self._tree)
+
+            found = [d for d, remainder in zip(divisors, remainders) if remainder == 0 and d < number]
+
+            if found:
+                with self.connection:
+                    self.connection.executemany('UPDATE divisors SET last_used = ? WHERE divisor = ?',
+                                                [(time.time(), str(d)) for d in found])
+
+        return found
+
+    def lookup_order(self, base: int, modulus: int) -> int:
+        """
+        Returns the cached order of base modulo modulus, or None.
+        """
+        key = (str(base % modulus), str(modulus))
+
+        with self._lock:
+            row = self.connection.execute('SELECT value FROM orders WHERE base = ? AND modulus = ?', key).fetchone()
+
+            if row is None:
+                return None
+
+            with self.connection:
+                self.connection.execute('UPDATE orders SET last_used = ? WHERE base = ? AND modulus = ?', (time.time(),) + key)
+
+        return int(row[0])
+
+    def store_order(self, base: int, modulus: int, order: int):
+        self._write('INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?)',
+                    [(str(base % modulus), str(modulus), str(order), time.time())])
+
+def _store_if_complete(store: FactorStore, number: int, factors: list):
+    if all(gmpy2.is_prime(p) for p, _ in factors):
+        store.store_factorization(number, factors)
+    else:
+        store.store_divisors([p for p, _ in factors if p != number])
+
+def cached_factor(factor_algo, order_algo, store: FactorStore, number: int, budget=None) -> list:
+    """
+    Factors number with factor_algo and order_algo, reusing store. A cached
+    factorization of number is returned as is; otherwise the cached divisors of
+    number split it first and only the cofactors left composite are factored. The
+    result and the factorizations of those cofactors are then cached.
+
+    A FactoringBudget given as budget is passed on to factor_algo. Factorizations
+    it leaves incomplete are returned but not cached.
+    """
+    factors = store.lookup_factorization(number)
+
+    if factors is not None:
+        return factors
+
+    factor_set = FactorSet([(number, 1)])
+
+    for d in store.dividing(number):
+        factor_set.split(d)
+
+    prime_list = []
+
+    for a, n in factor_set.pairs():
+        if a in factor_set.primes:
+            prime_list.append((a, n))
+            continue
+
+        cofactors = store.lookup_factorization(a) if a != number else None
+
+        if cofactors is None:
+            if budget is None:
+                cofactors = factor_algo.factor(int(a), order_algo)
+            else:
+                cofactors = factor_algo.factor(int(a), order_algo, budget=budget)
+
+            _store_if_complete(store, a, cofactors)
+
+        prime_list.extend((p, m * n) for p, m in cofactors)
+
+    factors = [(int(p), n) for p, n in consolidate_pairs(prime_list)]
+    _store_if_complete(store, number, factors)
+
+    return factors
@@ -0,0 +1,30 @@
+"""
+Stopping a pool of worker processes at once. ProcessPoolExecutor.shutdown cancels
+work that has not started but can only wait for work that has, so a factorization
+that runs out of budget would either wait for its slowest worker or return with
+busy processes left behind. terminate_pool ends the workers themselves.
+"""
+
+def terminate_pool(pool):
+    """
+    Cancels the work still queued on the ProcessPoolExecutor pool, terminates its
+    worker processes and waits for them and the pool's management thread to exit.
+    """
+    # Python 3.14 and later can terminate the workers itself
+    if hasattr(pool, 'terminate_workers'):
+        pool.terminate_workers()
+        return
+
+    processes = list((pool._processes or {}).values())
+    manager = pool._executor_manager_thread
+
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    for process in processes:
+        process.terminate()
+
+    for process in processes:
+        process.join()
+
+    if manager is not None:
+        manager.join()
@@ -1,45 +1,106 @@
 import gmpy2
+import numpy as np
 
-def baby_giant_order(invertible: int, modulus: int) -> int:
+from number_factorer.Orchestration.budget import CHECK_INTERVAL
+
+# measured size of one exponent -> residue entry of the baby-step dictionary
+DICT_ENTRY_BYTES = 120
+
+def baby_step_bound(modulus: int, max_table_entries: int = None) -> int:
+        """
+        Number of baby steps to store: ceil(sqrt(modulus - 1)), capped at max_table_entries.
+        """
+        baby_bound = int(gmpy2.ceil(gmpy2.sqrt(modulus - 1)))
+
+        if max_table_entries is not None:
+            baby_bound = max(1, min(baby_bound, max_table_entries))
+
+        return baby_bound
+
+def giant_step_bound(modulus: int, baby_bound: int) -> int:
+        """
+        Number of giant steps needed to reach every possible order, i.e. every
+        exponent up to modulus - 1, with the given number of baby steps.
+        """
+        return max(1, -(-(modulus - 1) // baby_bound))
+
+def baby_giant_order(invertible: int, modulus: int, max_table_entries: int = None, budget=None) -> int:
         """
         Finds the order of an invertible element in (Z/modulus)^* using Baby Steps, Giant Steps
         algorithm due to Shanks.
+
+        If max_table_entries is smaller than sqrt(modulus), only that many baby steps are
+        stored and correspondingly more giant steps are taken, which still gives the
+        exact order in O(modulus / max_table_entries) giant steps.
+
+        If a FactoringBudget is given as budget, it is checked every CHECK_INTERVAL steps
+        and BudgetExhausted is raised once it expires.
         """
 
+        # gmpy2 operands are faster to multiply and reduce than Python integers. The
+        # table needs hashable keys, so immutable mpz values are used rather than xmpz.
+        modulus = gmpy2.mpz(modulus)
+        invertible = invertible % modulus
+
+        if invertible == 1:
+            return 1
+
         # compute bound for first round of exponentiation
-        baby_bound = int(gmpy2.ceil(gmpy2.sqrt(modulus - 1)))
+        baby_bound = baby_step_bound(modulus, max_table_entries)
 
-        # initialize a dictionary of modular powers
-        power_dict = {1:invertible}
+        # initialize a dictionary sending each modular power to its exponent
+        power_dict = {invertible: 1}
 
         # begin at the first power
         baby_power = invertible
 
         # BABY STEPS: compute invertible ** i for i between 2 and baby_bound
         for i in range(2, baby_bound + 1):
+            if budget is not None and i % CHECK_INTERVAL == 0:
+                budget.check()
+
             baby_power = (invertible * baby_power) % modulus
 
             # if we hit 1 at any point, we've already found the bound
             if baby_power == 1:
                 return i
-        
-            # add power to the dictionary of powers
-            else:
-                power_dict[i] = baby_power
-    
-        # GIANT STEPS: now compute powers of the form invertible ** (i * baby_bound) until a 
-        # collision is detected with an already computed power
+
+            # the powers are distinct until 1 is hit, so each value gets a single exponent
+            power_dict[baby_power] = i
+
+        # GIANT STEPS: now compute powers of the form invertible ** (i * baby_bound) until a
+        # collision is detected with a baby step. The table is only read from here on.
+        # Since the order is at most modulus - 1, at most giant_step_bound giant steps
+        # are needed.
 
         exponent = 2 * baby_bound
         big_power = pow(baby_power, 2, modulus)
 
-        while big_power not in power_dict.values():
-            power_dict[exponent] = big_power
+        for i in range(giant_step_bound(modulus, baby_bound)):
+            if budget is not None and i % CHECK_INTERVAL == 0:
+                budget.check()
+
+            other_exponent = power_dict.get(big_power)
+
+            # the first collision gives the smallest exponent, since the windows
+            # [exponent - baby_bound, exponent - 1] are searched in increasing order
+            if other_exponent is not None:
+                return exponent - other_exponent
 
             big_power = (big_power * baby_power) % modulus
             exponent = exponent + baby_bound
 
-        # Compute the collision
-        other_exponent = min((j for j in power_dict if power_dict[j] == big_power))
+        return None
+
+def sorted_table_lookup(values, block):
+        """
+        Given a sorted uint64 array of baby-step values and a uint64 array block of
+        giant-step values, returns (hits, positions) where hits are the indices of
+        block found in values and positions their indices in values.
+        """
+        positions = np.searchsorted(values, block)
+        positions[positions == len(values)] = 0
+
+        hits = np.flatnonzero(values[positions] == block)
 
-        return exponent - other_exponent
\ No newline at end of file
+        return hits, positions[hits]
@@ -0,0 +1,126 @@
+import os
+import tempfile
+
+import numpy as np
+
+from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order, baby_step_bound, giant_step_bound, sorted_table_lookup
+
+"""
+Baby Steps, Giant Steps with the baby-step table kept on disk. The table is a
+memory-mapped file of fixed-width (value, exponent) records, 16 bytes each.
+After the baby steps the file is sorted by value in runs of RUN_SIZE records,
+so sorting never needs more than a run's worth of memory. Giant steps are
+looked up in blocks by binary search in every run, so only the pages they
+touch are brought into memory and the operating system's page cache decides
+how much of the table stays resident.
+"""
+
+RECORD = np.dtype([('value', '<u8'), ('exponent', '<u8')])
+
+# baby steps are written and giant steps looked up this many at a time
+BLOCK_SIZE = 1 << 16
+
+# records sorted together in memory, 64 MiB worth
+RUN_SIZE = 1 << 22
+
+# memory per record while a run is sorted: the permutation and the reordered copy
+RUN_ENTRY_BYTES = 40
+
+def disk_baby_giant_order(invertible: int, modulus: int, table_dir: str = None, max_table_entries: int = None,
+                          run_size: int = RUN_SIZE, budget=None) -> int:
+        """
+        Finds the order of an invertible element in (Z/modulus)^* using Baby Steps, Giant Steps
+        algorithm due to Shanks, storing at most max_table_entries baby steps in a temporary
+        file in table_dir (the system temporary directory if None), sorted in runs of
+        run_size records. The modulus must be below 2 ** 64.
+
+        If a FactoringBudget is given as budget, it is checked before every block of
+        steps and BudgetExhausted is raised once it expires.
+        """
+        if modulus >= 2 ** 64:
+            raise ValueError('disk-backed tables store residues as 64-bit integers, modulus must be below 2 ** 64')
+
+        invertible = invertible % modulus
+
+        if invertible == 1:
+            return 1
+
+        baby_bound = baby_step_bound(modulus, max_table_entries)
+
+        # tiny tables are not worth a file
+        if baby_bound < BLOCK_SIZE:
+            return baby_giant_order(invertible, modulus, max_table_entries, budget)
+
+        descriptor, path = tempfile.mkstemp(prefix='bsgs-', suffix='.table', dir=table_dir)
+        os.close(descriptor)
+
+        try:
+            table = np.memmap(path, dtype=RECORD, mode='w+', shape=(baby_bound,))
+
+            # BABY STEPS: compute invertible ** i for i between 1 and baby_bound, a block at a time
+            baby_power = 1
+
+            for start in range(1, baby_bound + 1, BLOCK_SIZE):
+                stop = min(start + BLOCK_SIZE, baby_bound + 1)
+                block = []
+
+                if budget is not None:
+                    budget.check()
+
+                for i in range(start, stop):
+                    baby_power = (invertible * baby_power) % modulus
+
+                    # if we hit 1 at any point, we've already found the bound
+                    if baby_power == 1:
+                        return i
+
+                    block.append(baby_power)
+
+                table['value'][start - 1:stop - 1] = block
+                table['exponent'][start - 1:stop - 1] = np.arange(start, stop, dtype=np.uint64)
+
+            # sort the records by value one run at a time
+            runs = []
+
+            for start in range(0, baby_bound, run_size):
+                run = table[start:start + run_size]
+                run[:] = run[np.argsort(run['value'], kind='stable')]
+                runs.append((run['value'], run['exponent']))
+
+            table.flush()
+
+            # GIANT STEPS: compute invertible ** (i * baby_bound) for i between 2 and
+            # giant_bound + 1 until a collision with a baby step is found
+            giant_bound = giant_step_bound(modulus, baby_bound)
+            big_power = pow(baby_power, 2, modulus)
+
+            for start in range(2, giant_bound + 2, BLOCK_SIZE):
+                stop = min(start + BLOCK_SIZE, giant_bound + 2)
+                block = []
+
+                if budget is not None:
+                    budget.check()
+
+                for _ in range(start, stop):
+                    block.append(big_power)
+                    big_power = (big_power * baby_power) % modulus
+
+                block = np.array(block, dtype=np.uint64)
+                collisions = []
+
+                for values, exponents in runs:
+                    hits, positions = sorted_table_lookup(values, block)
+
+                    if hits.size:
+                        collisions.append((int(hits[0]), int(exponents[positions[0]])))
+
+                # the earliest giant step in the block with a collision gives the order
+                if collisions:
+                    i, j = min(collisions)
+                    return (start + i) * baby_bound - j
+
+            return None
+
+        finally:
+            table = run = runs = values = exponents = None
+            os.remove(path)
@@ -0,0 +1,40 @@
+import gmpy2
+
+"""
+Reducer objects for the modular multiply-and-reduce loops. A reducer is built
+once per modulus and keeps the modulus (and anything derived from it) as gmpy2
+integers, and hands out mutable xmpz accumulators that are multiplied, squared
+and reduced in place, so the hot loops do not allocate a new integer per step.
+
+    reducer = ModularReducer(modulus)
+    x = reducer.element(base)
+    reducer.mul(x, multiplier)   # x = (x * multiplier) % modulus, in place
+    reducer.square(x)            # x = (x * x) % modulus, in place
+
+Loops that run hundreds of millions of times can read reducer.modulus into a
+local and inline the two in-place operations to avoid the method call.
+"""
+
+class ModularReducer:
+    """
+    Reduction with GMP's division, which is the fastest option for every size
+    measured in benchmarks/bench_modular_loops.py.
+    """
+    __slots__ = ('modulus',)
+
+    def __init__(self, modulus: int):
+        self.modulus = gmpy2.mpz(modulus)
+
+    def element(self, value: int):
+        """
+        Returns value % modulus as a mutable xmpz accumulator.
+        """
+        return gmpy2.xmpz(value % self.modulus)
+
+    def mul(self, x, y):
+        x *= y
+        x %= self.modulus
+
+    def square(self, x):
+        x *= x
+        x %= self.modulus
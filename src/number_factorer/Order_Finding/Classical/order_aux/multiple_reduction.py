@@ -0,0 +1,123 @@
+import random
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.prime_sieve import primes_below
+from number_factorer.Orchestration.budget import CHECK_INTERVAL
+
+"""
+Helpers for turning a known multiple of an order into the exact order. An
+exponent M with invertible ** M == 1 mod modulus is a multiple of the order,
+so stripping the prime factors p of M for which invertible ** (M / p) == 1
+recovers the order. This needs the factorization of M, which is found with
+trial division and Brent's variant of Pollard's rho.
+"""
+
+# primes below this bound are removed by trial division before Pollard's rho
+TRIAL_BOUND = 100
+
+def pollard_brent(number: int, max_iterations: int = None, budget=None):
+    """
+    Brent's variant of Pollard's rho algorithm. Returns a non-trivial divisor of
+    the composite integer number, or None if none was found within max_iterations
+    iterations of the random walk (unbounded if max_iterations is None) or before
+    the FactoringBudget budget, if given, expired.
+    """
+    number = gmpy2.mpz(number)
+
+    if number % 2 == 0:
+        return gmpy2.mpz(2)
+
+    iterations = 0
+    while True:
+        y = gmpy2.mpz(random.randint(1, number - 1))
+        c = gmpy2.mpz(random.randint(1, number - 1))
+        batch = 128
+
+        d = gmpy2.mpz(1)
+        q = gmpy2.mpz(1)
+        cycle_length = 1
+
+        while d == 1:
+            x = y
+            for i in range(cycle_length):
+                if budget is not None and i % CHECK_INTERVAL == 0 and budget.expired():
+                    return None
+
+                y = (y * y + c) % number
+
+            k = 0
+            while k < cycle_length and d == 1:
+                ys = y
+                for _ in range(min(batch, cycle_length - k)):
+                    y = (y * y + c) % number
+                    q = (q * abs(x - y)) % number
+
+                d = gmpy2.gcd(q, number)
+                k += batch
+
+                if budget is not None and k % CHECK_INTERVAL == 0 and d == 1 and budget.expired():
+                    return None
+
+            iterations += cycle_length
+            cycle_length *= 2
+
+            if max_iterations is not None and iterations > max_iterations and d == 1:
+                return None
+
+        # the batched gcd overshot, so backtrack one step at a time
+        if d == number:
+            d = gmpy2.mpz(1)
+            while d == 1:
+                ys = (ys * ys + c) % number
+                d = gmpy2.gcd(abs(x - ys), number)
+
+        if d != number:
+            return d
+
+def factor_integer(number: int) -> dict:
+    """
+    Returns the prime factorization of a positive integer as a dictionary
+    {p_1: n_1, ..., p_k: n_k} with (p_1 ** n_1) * ... * (p_k ** n_k) == number.
+    """
+    factors = {}
+
+    # remove small primes by trial division
+    for p in primes_below(TRIAL_BOUND).tolist():
+        while number % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            number //= p
+
+    # split the rest with Pollard's rho
+    stack = [gmpy2.mpz(number)] if number > 1 else []
+
+    while stack:
+        m = stack.pop()
+
+        if gmpy2.is_prime(m):
+            factors[int(m)] = factors.get(int(m), 0) + 1
+            continue
+
+        d = pollard_brent(m)
+        stack.extend([d, m // d])
+
+    return factors
+
+def order_from_multiple(invertible: int, modulus: int, multiple: int, factorization: dict = None) -> int:
+    """
+    Given a positive multiple of the order of invertible modulo modulus, returns the
+    order itself. If the factorization {p: n} of multiple is already known it can be
+    passed in, otherwise it is computed.
+    """
+    if factorization is None:
+        factorization = factor_integer(multiple)
+
+    order = multiple
+
+    for p, n in factorization.items():
+        for _ in range(n):
+            if pow(invertible, order // p, modulus) != 1:
+                break
+
+            order //= p
+
+    return order
@@ -0,0 +1,218 @@
+import math
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order, baby_step_bound, giant_step_bound, sorted_table_lookup
+from number_factorer.Orchestration.budget import BudgetExhausted
+
+"""
+Baby Steps, Giant Steps spread over a pool of processes. The baby-step table is
+a pair of uint64 arrays (values sorted, and their exponents) in shared memory,
+so it is built once and read by every worker without copying. Each worker scans
+a disjoint range of giant steps against it, and a shared counter holding the
+smallest colliding giant step found so far lets every worker stop as soon as
+its remaining steps can no longer give a smaller order. Setting it to STOPPED
+stops every worker, which is how a search is abandoned when its budget expires.
+"""
+
+# below this many baby steps the serial algorithm is faster than starting a pool
+PARALLEL_THRESHOLD = 1 << 16
+
+# giant steps are looked up in the table this many at a time
+BLOCK_SIZE = 1024
+
+# 16 bytes of shared table per baby step, plus the permutation and copy used to sort it
+SHARED_ENTRY_BYTES = 40
+
+# value of the shared counter telling the workers to stop
+STOPPED = -1
+
+# seconds between budget checks while waiting for the workers
+POLL_INTERVAL = 0.05
+
+_table = None
+
+def _attach(shm_name: str, baby_bound: int, best):
+    """
+    Pool initializer: maps the shared baby-step table into the worker.
+    """
+    global _table
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    values = np.ndarray((baby_bound,), dtype=np.uint64, buffer=shm.buf)
+    exponents = np.ndarray((baby_bound,), dtype=np.uint64, buffer=shm.buf, offset=8 * baby_bound)
+
+    _table = (shm, values, exponents, best)
+
+def _baby_steps(invertible: int, modulus: int, start: int, stop: int):
+    """
+    Writes invertible ** j for start <= j < stop into the shared table. Returns the
+    first such j with invertible ** j == 1, or None, also when told to stop.
+    """
+    _, values, exponents, best = _table
+
+    power = pow(invertible, start, modulus)
+    block = []
+
+    for j in range(start, stop):
+        if power == 1:
+            return j
+
+        if (j - start) % BLOCK_SIZE == 0 and best.value == STOPPED:
+            return None
+
+        block.append(power)
+        power = (power * invertible) % modulus
+
+    values[start - 1:stop - 1] = block
+    exponents[start - 1:stop - 1] = np.arange(start, stop, dtype=np.uint64)
+
+    return None
+
+def _giant_steps(invertible: int, modulus: int, baby_bound: int, start: int, stop: int):
+    """
+    Scans the giant steps invertible ** (i * baby_bound) for start <= i < stop against
+    the shared table. Returns (i, j) for the first collision with invertible ** j, or
+    None if there is none or a smaller collision has already been found elsewhere.
+    """
+    _, values, exponents, best = _table
+
+    giant_step = pow(invertible, baby_bound, modulus)
+    power = pow(giant_step, start, modulus)
+
+    for block_start in range(start, stop, BLOCK_SIZE):
+        if best.value <= block_start:
+            return None
+
+        block_stop = min(block_start + BLOCK_SIZE, stop)
+        block = []
+
+        for _ in range(block_start, block_stop):
+            block.append(power)
+            power = (power * giant_step) % modulus
+
+        hits, positions = sorted_table_lookup(values, np.array(block, dtype=np.uint64))
+
+        if hits.size:
+            i = block_start + int(hits[0])
+
+            with best.get_lock():
+                best.value = min(best.value, i)
+
+            return i, int(exponents[positions[0]])
+
+    return None
+
+def _ranges(start: int, stop: int, pieces: int):
+    """
+    Splits range(start, stop) into consecutive (start, stop) pairs of roughly equal size.
+    """
+    size = max(1, math.ceil((stop - start) / pieces))
+
+    return [(i, min(i + size, stop)) for i in range(start, stop, size)]
+
+def _wait(pending, best, budget):
+    """
+    Waits for the first of the futures pending to finish, returning (done, pending).
+    If the FactoringBudget budget expires first, the workers are told to stop and
+    BudgetExhausted is raised.
+    """
+    if budget is None:
+        return wait(pending, return_when=FIRST_COMPLETED)
+
+    while True:
+        done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+        if budget.expired():
+            best.value = STOPPED
+            raise BudgetExhausted
+
+        if done:
+            return done, pending
+
+def parallel_baby_giant_order(invertible: int, modulus: int, workers: int = None, max_table_entries: int = None,
+                              budget=None) -> int:
+    """
+    Finds the order of an invertible element in (Z/modulus)^* using Baby Steps, Giant Steps
+    algorithm due to Shanks, with the baby steps and giant steps split across workers
+    processes (all cores if workers is None). At most max_table_entries baby steps
+    are stored.
+
+    If a FactoringBudget is given as budget, it is checked while waiting for the
+    workers. Once it expires the workers are stopped and BudgetExhausted is raised.
+    """
+    invertible = invertible % modulus
+    baby_bound = baby_step_bound(modulus, max_table_entries)
+
+    # the table stores residues as uint64, and small problems are not worth a pool
+    if modulus >= 2 ** 64 or baby_bound < PARALLEL_THRESHOLD or invertible == 1:
+        return baby_giant_order(invertible, modulus, max_table_entries, budget)
+
+    workers = workers or multiprocessing.cpu_count()
+
+    shm = shared_memory.SharedMemory(create=True, size=16 * baby_bound)
+    best = multiprocessing.Value('q', 2 ** 62)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(shm.name, baby_bound, best)) as pool:
+
+            # BABY STEPS: each worker fills a contiguous piece of the table
+            futures = [pool.submit(_baby_steps, invertible, modulus, start, stop)
+                       for start, stop in _ranges(1, baby_bound + 1, workers)]
+
+            pending = set(futures)
+
+            while pending:
+                _, pending = _wait(pending, best, budget)
+
+            hits = [f.result() for f in futures]
+            hits = [j for j in hits if j is not None]
+
+            if hits:
+                return min(hits)
+
+            # sort the table by value so giant steps can binary search it
+            values = np.ndarray((baby_bound,), dtype=np.uint64, buffer=shm.buf)
+            exponents = np.ndarray((baby_bound,), dtype=np.uint64, buffer=shm.buf, offset=8 * baby_bound)
+
+            order = np.argsort(values, kind='stable')
+            values[:] = values[order]
+            exponents[:] = exponents[order]
+            del order, values, exponents
+
+            # GIANT STEPS: at most giant_bound of them are needed since the order is
+            # at most modulus - 1. Small ranges keep the early steps spread out.
+            giant_bound = giant_step_bound(modulus, baby_bound)
+
+            futures = {pool.submit(_giant_steps, invertible, modulus, baby_bound, start, stop): start
+                       for start, stop in _ranges(2, giant_bound + 2, 8 * workers)}
+
+            collisions = []
+            pending = set(futures)
+
+            while pending:
+                done, pending = _wait(pending, best, budget)
+                collisions.extend(f.result() for f in done if f.result() is not None)
+
+                # cancel queued ranges that can only find a larger collision
+                if collisions:
+                    smallest = min(collisions)[0]
+
+                    for f in list(pending):
+                        if futures[f] > smallest and f.cancel():
+                            pending.discard(f)
+
+            if not collisions:
+                return None
+
+            i, j = min(collisions)
+
+            return i * baby_bound - j
+
+    finally:
+        shm.close()
+        shm.unlink()
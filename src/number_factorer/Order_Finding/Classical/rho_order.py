@@ -0,0 +1,73 @@
+import random
+import gmpy2
+
+from number_factorer.Order_Finding.Classical.order_aux.multiple_reduction import order_from_multiple
+from number_factorer.Orchestration.budget import CHECK_INTERVAL
+
+"""
+Order finding with a Pollard rho style random walk. The walk moves through the
+powers of an invertible, multiplying by one of a fixed set of jump powers chosen
+by the current value, and keeps track of the exponent it has reached. Brent's
+cycle detection finds a repeated value using constant memory, and the difference
+of the two exponents at the repeat is a multiple of the order, which is then
+reduced to the order itself.
+"""
+
+def rho_order(invertible: int, modulus: int, partitions: int = 32, budget=None) -> int:
+    """
+    Finds the order of an invertible element in (Z/modulus)^* in expected
+    O(sqrt(order)) multiplications and O(1) memory. If a FactoringBudget is given as
+    budget, it is checked every CHECK_INTERVAL steps and BudgetExhausted is raised
+    once it expires.
+    """
+    if gmpy2.gcd(invertible, modulus) != 1:
+        return None
+
+    invertible = gmpy2.mpz(invertible % modulus)
+    modulus = gmpy2.mpz(modulus)
+
+    if invertible == 1:
+        return 1
+
+    # jumps of size around sqrt(modulus) so that a cycle closes after
+    # O(sqrt(order)) steps regardless of the size of the order
+    jump_bound = 2 * gmpy2.isqrt(modulus) + 1
+    jump_exponents = [random.randint(1, jump_bound) for _ in range(partitions)]
+    jump_powers = [pow(invertible, s, modulus) for s in jump_exponents]
+
+    # random starting point invertible ** start_exponent
+    start_exponent = random.randint(0, modulus - 1)
+
+    tortoise = pow(invertible, start_exponent, modulus)
+    tortoise_exponent = start_exponent
+
+    k = int(tortoise % partitions)
+    hare = (tortoise * jump_powers[k]) % modulus
+    hare_exponent = tortoise_exponent + jump_exponents[k]
+
+    # BRENT'S CYCLE DETECTION: the tortoise teleports to the hare at powers of two
+    power = 1
+    cycle_length = 1
+    steps = 0
+
+    while tortoise != hare:
+        steps += 1
+
+        if budget is not None and steps % CHECK_INTERVAL == 0:
+            budget.check()
+
+        if power == cycle_length:
+            tortoise = hare
+            tortoise_exponent = hare_exponent
+            power *= 2
+            cycle_length = 0
+
+        k = int(hare % partitions)
+        hare = (hare * jump_powers[k]) % modulus
+        hare_exponent += jump_exponents[k]
+        cycle_length += 1
+
+    # invertible ** hare_exponent == invertible ** tortoise_exponent
+    multiple = hare_exponent - tortoise_exponent
+
+    return int(order_from_multiple(invertible, modulus, multiple))
@@ -1,5 +1,6 @@
 from qiskit import QuantumCircuit
 import numpy as np
+from .gate_cache import gate_cache
 
 def QFT(nqbits):
     """
@@ -30,6 +31,7 @@ def QFT(nqbits):
 
     return qc
 
+@gate_cache
 def QFT_gate(nqbits):
     """
     QFT on nqbits turned into a gate.
@@ -37,6 +39,7 @@ def QFT_gate(nqbits):
 
     return QFT(nqbits).to_gate(label=f'QFT({nqbits})')
 
+@gate_cache
 def IQFT_gate(nqbits):
     """
     Inverse QFT on nqbits turned into a gate.
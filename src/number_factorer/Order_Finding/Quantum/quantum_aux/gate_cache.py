@@ -0,0 +1,41 @@
+import functools
+
+"""
+Memoization for the gate constructors. Building a gate means building its circuit
+and, for the controlled adders, synthesizing the controlled version, which is where
+most of the time of building an order finding circuit goes. The same gates are
+built over and over (the QFT of a given width, the adders for the doubled
+multiplier, the multipliers for the powers of the base), so each constructor keeps
+its recent gates in a bounded LRU cache keyed by its integer arguments.
+
+Cached gates are shared between every circuit they are appended to and must not be
+modified; gate methods such as inverse and control return new gates and are safe.
+"""
+
+# gates kept by each cached constructor
+GATE_CACHE_SIZE = 256
+
+_cached_constructors = []
+
+def gate_cache(constructor):
+    """
+    Decorator caching the gates returned by constructor in an LRU cache of
+    GATE_CACHE_SIZE entries.
+    """
+    cached = functools.lru_cache(maxsize=GATE_CACHE_SIZE)(constructor)
+    _cached_constructors.append(cached)
+
+    return cached
+
+def gate_cache_info() -> dict:
+    """
+    Returns the cache statistics of every cached constructor, keyed by its name.
+    """
+    return {cached.__name__: cached.cache_info() for cached in _cached_constructors}
+
+def clear_gate_caches():
+    """
+    Empties the caches of every cached constructor.
+    """
+    for cached in _cached_constructors:
+        cached.cache_clear()
@@ -1,6 +1,7 @@
 from qiskit import QuantumCircuit
 from .QFT import QFT_gate, IQFT_gate
 from .semi_classical_modular_adder import phiaddmod_gate
+from .gate_cache import gate_cache
 
 def cmult(multiplier, modulus, nbits):
 
@@ -19,11 +20,8 @@ def cmult(multiplier, modulus, nbits):
 
     for i in range(nbits):
 
-        power2_gate = phiaddmod_gate(
-            summand= add_on, 
-            modulus=modulus,
-            nqbits=nbits + 3
-        )
+        # positional arguments, so that every call shares one cache key
+        power2_gate = phiaddmod_gate(add_on, modulus, nbits + 3)
         qc.append(power2_gate, [0, nbits - i] + lastest_qubits)
         add_on = (2 * add_on) % modulus
     
@@ -33,10 +31,12 @@ def cmult(multiplier, modulus, nbits):
 
     return qc
 
+@gate_cache
 def cmult_gate(multiplier, modulus, nbits):
 
     return cmult(multiplier, modulus, nbits).to_gate(label=f'CMULT({multiplier}, {modulus})')
 
+@gate_cache
 def Icmult_gate(multiplier, modulus, nbits):
 
     return cmult(multiplier, modulus, nbits).inverse().to_gate(label=f'ICMULT({multiplier}, {modulus})')
@@ -71,6 +71,7 @@ def shorU(multiplier, modulus, nbits):
 
     return qc
 
+@gate_cache
 def shorU_gate(multiplier, modulus, nbits):
 
     return shorU(multiplier, modulus, nbits).to_gate(label=f'U({multiplier}, {modulus})')
\ No newline at end of file
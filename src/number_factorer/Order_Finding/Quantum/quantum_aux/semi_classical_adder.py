@@ -1,5 +1,6 @@
 from qiskit import QuantumCircuit
 import numpy as np
+from .gate_cache import gate_cache
 
 def phiadd(summand: int, nqbits: int):
     """
@@ -40,18 +41,22 @@ def phiadd(summand: int, nqbits: int):
     return qc
 
 
+@gate_cache
 def phiadd_gate(summand: int, nqbits: int):
 
     return phiadd(summand, nqbits).to_gate(label=f'phiadd({summand})')
 
+@gate_cache
 def Iphiadd_gate(summand: int, nqbits: int):
 
     return phiadd(summand, nqbits).inverse().to_gate(label=f'Iphiadd({summand})')
 
+@gate_cache
 def cphiadd_gate(summand: int, nqbits: int, nctrlqbits: int):
 
     return phiadd(summand, nqbits).control(nctrlqbits).to_gate(label=f'phiadd({summand})')
 
+@gate_cache
 def cIphiadd_gate(summand: int, nqbits: int, nctrlqbits: int):
 
     return phiadd(summand, nqbits).control(nctrlqbits).inverse().to_gate(label=f'Iphiadd({summand})')
\ No newline at end of file
@@ -1,6 +1,7 @@
 from qiskit import QuantumCircuit
 from .QFT import QFT_gate, IQFT_gate
 from .semi_classical_adder import Iphiadd_gate, cphiadd_gate, cIphiadd_gate
+from .gate_cache import gate_cache
 
 def phiaddmod(summand: int, modulus: int, nqbits: int):
     """
@@ -63,6 +64,7 @@ def phiaddmod(summand: int, modulus: int, nqbits: int):
 
     return qc
 
+@gate_cache
 def phiaddmod_gate(summand, modulus, nqbits):
 
     return phiaddmod(summand, modulus, nqbits).to_gate(label=f'phiaddmod({summand}, {modulus})')
\ No newline at end of file
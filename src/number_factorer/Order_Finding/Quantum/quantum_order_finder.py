@@ -1,26 +1,156 @@
+import asyncio
 import numpy as np
 from qiskit_aer import AerSimulator
 from qiskit import transpile
+import gmpy2
 from number_factorer.Order_Finding.Quantum.quantum_aux.continued_fractions import get_denominator
+from number_factorer.Order_Finding.Classical.order_aux.multiple_reduction import order_from_multiple
+from number_factorer.Orchestration.async_executor import circuit_executor
 
-def quantum_order_finder(number, modulus, quantum_circuit, algo_name):
+# measurements taken per simulator job; another job is only run if none of them
+# reveals the order
+SHOTS = 64
+
+def order_from_counts(counts: dict, number: int, modulus: int, algo_name: str) -> int:
+    """
+    Tries the measurements in the counts histogram from most to least frequent and
+    returns the order of number modulo modulus, or 0 if none of them reveals it.
+    A measurement approximating j / r with gcd(j, r) > 1 only gives a divisor of the
+    order r, so the denominators found are also combined by lcm, and the first
+    multiple of the order obtained is reduced to the order itself.
+    """
+    multiple = 1
+
+    for measurement in sorted(counts, key=counts.get, reverse=True):
+        denominator = get_denominator(measurement, modulus, algo_name)
+
+        if pow(number, denominator, modulus) == 1:
+            return order_from_multiple(number, modulus, denominator)
+
+        combined = int(gmpy2.lcm(multiple, denominator))
+
+        if pow(number, combined, modulus) == 1:
+            return order_from_multiple(number, modulus, combined)
+
+        # the order is below modulus, so a larger lcm contains a wrong denominator
+        if combined < modulus:
+            multiple = combined
+
+    return 0
+
+def quantum_order_finder(number, modulus, quantum_circuit, algo_name, shots: int = SHOTS):
+    """
+    Finds the order of number modulo modulus by simulating quantum_circuit, shots
+    measurements per simulator job, until the measurements reveal it.
+    """
 
     if np.gcd(number, modulus) != 1:
         print(f'{number} is not invertible modulo {modulus}')
         return 0
 
+    if pow(number, 2, modulus) == 1:
+        return order_from_multiple(number, modulus, 2)
+
     nbits = modulus.bit_length() 
 
     qc = quantum_circuit(number, modulus, nbits)
 
-    # simulate runs number of times, taking the result each time.
+    # simulate batches of shots until one of the measurements gives the order
     aer_simulator = AerSimulator()
     transpiled_circuit = transpile(qc, aer_simulator)
 
-    order = 2
-    while pow(number, order, modulus) != 1:
-        result = list(aer_simulator.run(transpiled_circuit, shots=1).result().get_counts())[0]
+    order = 0
+    while not order:
+        counts = aer_simulator.run(transpiled_circuit, shots=shots).result().get_counts()
             
-        order = get_denominator(result, modulus, algo_name)
+        order = order_from_counts(counts, number, modulus, algo_name)
     
-    return order
\ No newline at end of file
+    return order
+
+def quantum_order_finder_batch(numbers, modulus, quantum_circuit, algo_name, shots: int = SHOTS):
+    """
+    Finds the orders of several numbers modulo the same modulus. The circuits
+    for all numbers still missing an order are submitted together as a single
+    simulator job of shots measurements each on each round.
+    """
+    orders = [0] * len(numbers)
+    pending = []
+
+    for i, number in enumerate(numbers):
+        if np.gcd(number, modulus) != 1:
+            print(f'{number} is not invertible modulo {modulus}')
+            continue
+
+        if pow(number, 2, modulus) == 1:
+            orders[i] = order_from_multiple(number, modulus, 2)
+        else:
+            pending.append(i)
+
+    if not pending:
+        return orders
+
+    nbits = modulus.bit_length()
+
+    aer_simulator = AerSimulator()
+    transpiled_circuits = transpile([quantum_circuit(numbers[i], modulus, nbits) for i in pending], aer_simulator)
+    transpiled_circuits = dict(zip(pending, transpiled_circuits))
+
+    while pending:
+        result = aer_simulator.run([transpiled_circuits[i] for i in pending], shots=shots).result()
+
+        for k, i in enumerate(pending):
+            orders[i] = order_from_counts(result.get_counts(k), numbers[i], modulus, algo_name)
+
+        pending = [i for i in pending if not orders[i]]
+
+    return orders
+
+# the longest wait, in seconds, between two checks on a running simulator job
+JOB_POLL_INTERVAL = 0.05
+
+async def await_job(job):
+    """
+    Waits for a simulator job without blocking the event loop and returns its result.
+    If the waiting coroutine is cancelled, the job is cancelled too when it has not
+    started yet. Aer cannot interrupt a job that is already running, so such a job
+    runs to the end in Aer's own thread and its result is discarded.
+    """
+    delay = 0.001
+
+    try:
+        while not job.in_final_state():
+            await asyncio.sleep(delay)
+            delay = min(2 * delay, JOB_POLL_INTERVAL)
+
+    except asyncio.CancelledError:
+        job.cancel()
+        raise
+
+    return job.result()
+
+async def quantum_order_finder_async(number, modulus, quantum_circuit, algo_name, shots: int = SHOTS,
+                                     executor=None):
+    """
+    The coroutine version of quantum_order_finder. The circuit is built and transpiled
+    on executor, or the circuit executor if None, and each simulator job is awaited
+    rather than waited on, so cancelling the coroutine submits no further jobs.
+    """
+    if np.gcd(number, modulus) != 1:
+        print(f'{number} is not invertible modulo {modulus}')
+        return 0
+
+    if pow(number, 2, modulus) == 1:
+        return order_from_multiple(number, modulus, 2)
+
+    nbits = modulus.bit_length()
+
+    aer_simulator = AerSimulator()
+    loop = asyncio.get_running_loop()
+    transpiled_circuit = await loop.run_in_executor(executor or circuit_executor(), lambda: transpile(quantum_circuit(number, modulus, nbits), aer_simulator))
+
+    order = 0
+    while not order:
+        result = await await_job(aer_simulator.run(transpiled_circuit, shots=shots))
+        order = order_from_counts(result.get_counts(), number, modulus, algo_name)
+
+    return order
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+import gmpy2
+
+from number_factorer.Order_Finding.Classical.order_aux.multiple_reduction import factor_integer, order_from_multiple
+
+class OrderCache:
+    """
+    A bounded least-recently-used store of multiplicative orders keyed by
+    (base, modulus). For each modulus it also keeps the least common multiple
+    of all known orders together with its factorization, so that any base
+    whose order divides that multiple can be answered by reducing the multiple
+    instead of running an order finding algorithm.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.orders = OrderedDict()
+        self.multiples = OrderedDict()
+
+    def __len__(self):
+        return len(self.orders)
+
+    def clear(self):
+        self.orders.clear()
+        self.multiples.clear()
+
+    def lookup(self, base: int, modulus: int) -> int:
+        """
+        Returns the order of base modulo modulus if it is cached or can be derived
+        from the known orders for modulus. Returns None otherwise.
+        """
+        key = (base % modulus, modulus)
+
+        if key in self.orders:
+            self.orders.move_to_end(key)
+            return self.orders[key]
+
+        if modulus not in self.multiples:
+            return None
+
+        self.multiples.move_to_end(modulus)
+        multiple, factorization = self.multiples[modulus]
+
+        # the lcm of known orders is a multiple of the order of base exactly when
+        # base ** lcm == 1, in which case the order is found by reducing it
+        if pow(base, multiple, modulus) != 1:
+            return None
+
+        order = int(order_from_multiple(base, modulus, multiple, factorization))
+        self._insert(key, order)
+
+        return order
+
+    def power_order(self, base: int, exponent: int, modulus: int) -> int:
+        """
+        Returns the order of base ** exponent modulo modulus, using
+        ord(base ** k) = ord(base) / gcd(k, ord(base)), if the order of base is
+        cached. Returns None otherwise.
+        """
+        order = self.lookup(base, modulus)
+
+        if order is None:
+            return None
+
+        power_order = order // int(gmpy2.gcd(exponent, order))
+        self._insert((pow(base, exponent, modulus), modulus), power_order)
+
+        return power_order
+
+    def store(self, base: int, modulus: int, order: int):
+        """
+        Records that base has the given order modulo modulus and folds it into
+        the multiple kept for modulus.
+        """
+        self._insert((base % modulus, modulus), order)
+
+        multiple, factorization = self.multiples.pop(modulus, (1, {}))
+
+        if multiple % order != 0:
+            factorization = dict(factorization)
+
+            for p, n in factor_integer(order).items():
+                factorization[p] = max(factorization.get(p, 0), n)
+
+            multiple = int(gmpy2.lcm(multiple, order))
+
+        self.multiples[modulus] = (multiple, factorization)
+
+        while len(self.multiples) > self.maxsize:
+            self.multiples.popitem(last=False)
+
+    def _insert(self, key, order):
+        self.orders[key] = order
+        self.orders.move_to_end(key)
+
+        while len(self.orders) > self.maxsize:
+            self.orders.popitem(last=False)
+
+def find_orders_sharing_multiples(find_order, bases, modulus: int) -> list:
+    """
+    Computes the orders of several bases modulo the same modulus with the single-base
+    order finder find_order. Orders already found are combined into a common
+    multiple, so later bases whose order divides it are answered by reduction.
+    """
+    modulus = gmpy2.mpz(modulus)
+    cache = OrderCache(max(len(bases), 1))
+    orders = []
+
+    for base in bases:
+        order = cache.lookup(base, modulus)
+
+        if order is None:
+            order = find_order(base, modulus)
+
+            if order:
+                cache.store(base, modulus, order)
+
+        orders.append(order)
+
+    return orders
@@ -3,8 +3,11 @@ from .Factor_Number import (
     Number_Factorer,
     IncrementOrder,
     BabyGiantOrder,
+    RhoOrder,
+    CachedOrder,
     ShorFactorization,
     EkeraFactorization,
+    PreFactorization,
     ShorOrder,
     BeauregardOrder
 )
@@ -13,8 +16,11 @@ __all__ = [
     "Number_Factorer",
     "IncrementOrder",
     "BabyGiantOrder",
+    "RhoOrder",
+    "CachedOrder",
     "ShorFactorization",
     "EkeraFactorization",
+    "PreFactorization",
     "ShorOrder",
     "BeauregardOrder",
 ]
\ No newline at end of file
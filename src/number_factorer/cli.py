@@ -0,0 +1,175 @@
+import argparse
+import json
+import os
+import sys
+
+from number_factorer.Factor_Number import (
+    Number_Factorer,
+    IncrementOrder,
+    BabyGiantOrder,
+    RhoOrder,
+    ShorOrder,
+    BeauregardOrder,
+    ShorFactorization,
+    EkeraFactorization,
+    PreFactorization,
+)
+
+"""
+The number-factorer command. Reads integers, one per line, from files or stdin
+as a stream and writes one JSON object per line,
+{"number": "N", "factors": [["p_1", n_1], ...]}, with integers as strings so that
+no consumer rounds them. With --resume, numbers already in the output file are
+skipped and new results are appended to it.
+"""
+
+FACTOR_ALGORITHMS = {
+    'shor': ShorFactorization,
+    'ekera': EkeraFactorization,
+}
+
+ORDER_ALGORITHMS = {
+    'increment': IncrementOrder,
+    'babygiant': BabyGiantOrder,
+    'rho': RhoOrder,
+    'shor': ShorOrder,
+    'beauregard': BeauregardOrder,
+}
+
+# output buffer size in bytes; results are also flushed every --flush-every lines
+OUTPUT_BUFFER = 1 << 20
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='number-factorer', description='Factor integers read one per line.')
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help='files of integers, one per line; - or nothing reads stdin')
+    parser.add_argument('-f', '--factor', choices=sorted(FACTOR_ALGORITHMS), default='shor',
+                        help='classical processing algorithm (default: shor)')
+    parser.add_argument('-a', '--order', choices=sorted(ORDER_ALGORITHMS), default='rho',
+                        help='order finding algorithm (default: rho)')
+    parser.add_argument('--prefactor', action='store_true',
+                        help='remove easy factors with trial division, rho, p-1 and ECM first')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='worker processes, 0 for all cores (default: 1)')
+    parser.add_argument('--chunksize', type=int, default=16,
+                        help='numbers sent to a worker at a time (default: 16)')
+    parser.add_argument('--ordered', action='store_true',
+                        help='write results in input order when using several workers')
+    parser.add_argument('-o', '--output', default='-',
+                        help='output file; - is stdout (default)')
+    parser.add_argument('--resume', action='store_true',
+                        help='skip numbers already in the output file and append to it')
+    parser.add_argument('--flush-every', type=int, default=1000,
+                        help='flush the output after this many results (default: 1000)')
+    parser.add_argument('--cache', default=None,
+                        help='SQLite file caching results across runs (single worker only)')
+
+    args = parser.parse_args(argv)
+
+    if args.resume and args.output == '-':
+        parser.error('--resume needs an --output file')
+
+    if args.cache is not None and args.workers != 1:
+        parser.error('--cache can only be used with a single worker')
+
+    return args
+
+def read_numbers(paths):
+    """
+    Yields the integers in the files at paths (- for stdin) one at a time, skipping
+    blank lines and lines starting with #. Invalid lines are reported on stderr.
+    """
+    for path in paths:
+        file = sys.stdin if path == '-' else open(path)
+
+        try:
+            for line_number, line in enumerate(file, 1):
+                line = line.strip()
+
+                if not line or line.startswith('#'):
+                    continue
+
+                try:
+                    number = int(line)
+                except ValueError:
+                    print(f'{path}:{line_number}: not an integer: {line!r}', file=sys.stderr)
+                    continue
+
+                if number < 2:
+                    print(f'{path}:{line_number}: cannot factor {number}', file=sys.stderr)
+                    continue
+
+                yield number
+
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+def completed_numbers(path: str) -> set:
+    """
+    Returns the numbers already written to the output file at path, as strings. A
+    final line cut short by an interruption is removed from the file.
+    """
+    done = set()
+
+    if not os.path.exists(path):
+        return done
+
+    with open(path, 'rb+') as file:
+        end = 0
+
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+
+            try:
+                done.add(json.loads(line)['number'])
+            except (ValueError, KeyError):
+                break
+
+            end += len(line)
+
+        file.truncate(end)
+
+    return done
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    factor_algo = FACTOR_ALGORITHMS[args.factor](prefactor=PreFactorization() if args.prefactor else None)
+    factorer = Number_Factorer(factor_algo, ORDER_ALGORITHMS[args.order](), cache_path=args.cache)
+
+    done = completed_numbers(args.output) if args.resume else set()
+    numbers = (number for number in read_numbers(args.inputs) if str(number) not in done)
+
+    if args.workers == 1:
+        results = ((number, factorer.factor(number)) for number in numbers)
+    else:
+        results = factorer.factor_many(numbers, args.workers or None, args.chunksize, args.ordered)
+
+    if args.output == '-':
+        output = sys.stdout
+    else:
+        output = open(args.output, 'a' if args.resume else 'w', buffering=OUTPUT_BUFFER)
+
+    try:
+        for count, (number, factors) in enumerate(results, 1):
+            record = {'number': str(number), 'factors': [[str(p), n] for p, n in factors]}
+            output.write(json.dumps(record) + '\n')
+
+            if count % args.flush_every == 0:
+                output.flush()
+
+    except KeyboardInterrupt:
+        return 130
+
+    finally:
+        output.flush()
+
+        if output is not sys.stdout:
+            output.close()
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
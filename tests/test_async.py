@@ -0,0 +1,75 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import gmpy2
+import pytest
+
+from number_factorer.Factor_Number import (Number_Factorer, ShorFactorization, BabyGiantOrder, RhoOrder,
+                                           ShorOrder, EventLoopOrder)
+from number_factorer.Orchestration import async_executor
+
+HARD = int(gmpy2.next_prime(2 ** 28 + 3)) * int(gmpy2.next_prime(2 ** 29 + 7))
+
+def test_factor_async_and_factor_partial_async():
+    factorer = Number_Factorer(ShorFactorization(), BabyGiantOrder())
+
+    async def main():
+        return await asyncio.gather(factorer.factor_async(101 * 103), factorer.factor_partial_async(HARD, max_order_calls=0))
+
+    full, partial = asyncio.run(main())
+
+    assert sorted(full) == [(101, 1), (103, 1)]
+    assert partial == [(HARD, 1, False)]
+
+@pytest.mark.parametrize('order_finder', [RhoOrder(), BabyGiantOrder()], ids=['rho', 'bsgs'])
+def test_cancelling_frees_the_worker_thread(order_finder):
+    factorer = Number_Factorer(ShorFactorization(), order_finder)
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def main():
+        task = asyncio.create_task(factorer.factor_async(HARD, executor))
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    # the search stops at its next budget check, so the only thread is free again
+    start = time.monotonic()
+    assert executor.submit(lambda: 1).result(timeout=5) == 1
+    assert time.monotonic() - start < 2
+
+    executor.shutdown()
+
+def test_cancelling_find_order_async():
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def main():
+        task = asyncio.create_task(RhoOrder().find_order_async(3, HARD, executor))
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert executor.submit(lambda: 1).result(timeout=2) == 1
+    executor.shutdown()
+
+def test_quantum_calls_do_not_need_a_free_shared_thread(monkeypatch):
+    # a factorization holds the only shared thread while it waits for the quantum call
+    monkeypatch.setattr(async_executor, '_executor', None)
+    monkeypatch.setattr(async_executor, '_max_workers', 1)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        order_finder = EventLoopOrder(ShorOrder(), loop)
+        call = loop.run_in_executor(async_executor.shared_executor(), order_finder.find_order, 7, 15)
+
+        return await asyncio.wait_for(call, 60)
+
+    assert asyncio.run(main()) == 4
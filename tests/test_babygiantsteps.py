@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from number_factorer.Factor_Number import BabyGiantOrder
+from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder
+
+MODULI = [7, 15, 91, 1009, 4096, 7919 * 13, 65537]
+
+@pytest.mark.parametrize('modulus', MODULI)
+def test_matches_bad_order_finder(modulus):
+    rng = random.Random(modulus)
+
+    for _ in range(10):
+        base = rng.randrange(2, modulus)
+
+        if bad_order_finder(base, modulus) is None:
+            continue
+
+        assert baby_giant_order(base, modulus) == bad_order_finder(base, modulus)
+
+def test_base_one():
+    assert baby_giant_order(1, 101) == 1
+    assert baby_giant_order(102, 101) == 1
+
+@pytest.mark.parametrize('max_table_entries', [1, 7, 100])
+def test_small_table_gives_exact_order(max_table_entries):
+    for base in [2, 3, 5, 10, 12345]:
+        expected = bad_order_finder(base, 10007)
+
+        assert baby_giant_order(base, 10007, max_table_entries) == expected
+        assert BabyGiantOrder(max_table_entries=max_table_entries).find_order(base, 10007) == expected
@@ -0,0 +1,47 @@
+import itertools
+import math
+
+from number_factorer.Factor_Number import Number_Factorer, ShorFactorization, EkeraFactorization, BabyGiantOrder
+
+def trial_factor(number):
+    factors = []
+    p = 2
+
+    while p * p <= number:
+        if number % p == 0:
+            n = 0
+            while number % p == 0:
+                number //= p
+                n += 1
+            factors.append((p, n))
+        p += 1
+
+    if number > 1:
+        factors.append((number, 1))
+
+    return factors
+
+NUMBERS = list(range(6, 120)) + [1009 * 1013, 2 ** 5 * 3 ** 4 * 101]
+
+def test_ordered_results_match_trial_division():
+    factorer = Number_Factorer(ShorFactorization(), BabyGiantOrder())
+    results = list(factorer.factor_many(NUMBERS, workers=2, chunksize=5, ordered=True))
+
+    assert [number for number, _ in results] == NUMBERS
+    assert all(sorted(factors) == trial_factor(number) for number, factors in results)
+
+def test_unordered_results_cover_every_number():
+    factorer = Number_Factorer(EkeraFactorization(), BabyGiantOrder())
+    results = dict(factorer.factor_many(NUMBERS, workers=2, chunksize=3))
+
+    assert sorted(results) == sorted(NUMBERS)
+    assert all(math.prod(p ** n for p, n in results[number]) == number for number in NUMBERS)
+
+def test_unbounded_stream():
+    factorer = Number_Factorer(ShorFactorization(), BabyGiantOrder())
+    results = factorer.factor_many(itertools.count(10), workers=2, chunksize=4, ordered=True)
+
+    first = list(itertools.islice(results, 30))
+    results.close()
+
+    assert [number for number, _ in first] == list(range(10, 40))
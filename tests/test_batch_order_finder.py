@@ -0,0 +1,46 @@
+import random
+
+import numpy as np
+import pytest
+
+from number_factorer.Factor_Number import IncrementOrder
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder, batch_order_finder, VECTOR_MODULUS_BOUND
+
+def random_pairs(count, seed=0):
+    rng = random.Random(seed)
+    moduli = [rng.randrange(2, 5000) for _ in range(count)]
+
+    return [rng.randrange(0, 10000) for _ in range(count)], moduli
+
+@pytest.mark.parametrize('chunk_size, compact_every', [(1 << 16, 32), (7, 1), (50, 3)])
+def test_matches_bad_order_finder(chunk_size, compact_every):
+    numbers, moduli = random_pairs(300)
+    orders = batch_order_finder(numbers, moduli, chunk_size, compact_every)
+
+    for number, modulus, order in zip(numbers, moduli, orders):
+        assert order == (bad_order_finder(number, modulus) or 0)
+
+def test_single_modulus():
+    assert batch_order_finder([2, 3, 4, 5, 7], 9).tolist() == [6, 0, 3, 6, 3]
+
+def test_moduli_out_of_range():
+    with pytest.raises(ValueError):
+        batch_order_finder([2], [VECTOR_MODULUS_BOUND])
+
+    assert batch_order_finder(np.array([], dtype=np.int64), 7).size == 0
+
+def test_modulus_one():
+    assert batch_order_finder([0, 5], 1).tolist() == [1, 1]
+    assert bad_order_finder(5, 1) == 1
+    assert IncrementOrder().find_order_batch([0, 5], [1, 1]) == [1, 1]
+
+def test_find_order_batch_mixes_small_and_large_moduli():
+    # modulus - 1 has order 2, so the scalar path for the large modulus is quick
+    large = 2 ** 31 + 11
+    invertibles = [2, 6, 3, large - 1, 6]
+    moduli = [101, 15, 1009, large, 2 * large]
+
+    orders = IncrementOrder().find_order_batch(invertibles, moduli)
+
+    assert orders == [bad_order_finder(2, 101), None, bad_order_finder(3, 1009), 2, None]
+    assert IncrementOrder().find_orders([2, 5, 6], 15) == [4, None, None]
@@ -0,0 +1,88 @@
+import math
+import time
+
+import gmpy2
+import pytest
+
+from number_factorer.Factor_Number import (Number_Factorer, ShorFactorization, EkeraFactorization, PreFactorization,
+                                           IncrementOrder, BabyGiantOrder, RhoOrder, BudgetedOrder)
+from number_factorer.Orchestration.budget import FactoringBudget, BudgetExhausted
+
+# a semiprime of two 29-bit primes, far beyond a second of any classical order finder
+P, Q = int(gmpy2.next_prime(2 ** 28 + 3)), int(gmpy2.next_prime(2 ** 29 + 7))
+HARD = P * Q
+
+def test_budget_limits():
+    unlimited = FactoringBudget()
+
+    assert not unlimited.exhausted()
+    unlimited.charge(1000)
+    assert not unlimited.exhausted()
+
+    calls = FactoringBudget(max_order_calls=2)
+    calls.charge()
+    calls.charge()
+
+    assert calls.exhausted() and not calls.expired()
+
+    with pytest.raises(BudgetExhausted):
+        calls.charge()
+
+    assert calls.order_calls == 2
+
+    assert FactoringBudget(deadline=0).expired()
+
+    cancelled = FactoringBudget(deadline=100)
+    cancelled.cancel()
+
+    with pytest.raises(BudgetExhausted):
+        cancelled.check()
+
+def test_factor_returns_pairs_and_factor_partial_triples():
+    factorer = Number_Factorer(ShorFactorization(), BabyGiantOrder())
+    number = 2 ** 3 * 101 * 103 * 107
+
+    assert sorted(factorer.factor(number)) == [(2, 3), (101, 1), (103, 1), (107, 1)]
+    assert sorted(factorer.factor_partial(number)) == [(2, 3, True), (101, 1, True), (103, 1, True), (107, 1, True)]
+
+@pytest.mark.parametrize('factor_algo', [ShorFactorization(), EkeraFactorization()], ids=['shor', 'ekera'])
+def test_no_order_calls_leaves_the_composite(factor_algo):
+    factorer = Number_Factorer(factor_algo, BabyGiantOrder())
+
+    assert factorer.factor_partial(HARD, max_order_calls=0) == [(HARD, 1, False)]
+
+def test_partial_factorizations_multiply_back():
+    factorer = Number_Factorer(ShorFactorization(), BabyGiantOrder())
+    number = 101 * 103 * 107 * 109
+
+    for _ in range(10):
+        factors = factorer.factor_partial(number, max_order_calls=1)
+
+        assert math.prod(a ** n for a, n, _ in factors) == number
+        assert all(is_prime == bool(gmpy2.is_prime(a)) for a, _, is_prime in factors)
+
+@pytest.mark.parametrize('order_finder', [IncrementOrder(), BabyGiantOrder(), RhoOrder()], ids=['increment', 'bsgs', 'rho'])
+def test_deadline_stops_order_finding(order_finder):
+    factorer = Number_Factorer(ShorFactorization(), order_finder)
+    start = time.monotonic()
+
+    assert factorer.factor_partial(HARD, deadline=0.5) == [(HARD, 1, False)]
+    assert time.monotonic() - start < 2
+
+def test_deadline_stops_the_prefactor_stage():
+    prefactor = PreFactorization(rho_iterations=2 ** 40, pm1_bound=0, ecm_curves=0)
+    big = int(gmpy2.next_prime(2 ** 80)) * int(gmpy2.next_prime(2 ** 81))
+    factorer = Number_Factorer(ShorFactorization(prefactor=prefactor), RhoOrder())
+    start = time.monotonic()
+
+    assert factorer.factor_partial(big, deadline=0.5) == [(big, 1, False)]
+    assert time.monotonic() - start < 2
+
+def test_budgeted_order_raises_inside_a_search():
+    budget = FactoringBudget(deadline=0.3)
+    start = time.monotonic()
+
+    with pytest.raises(BudgetExhausted):
+        BudgetedOrder(RhoOrder(), budget).find_order(3, HARD)
+
+    assert time.monotonic() - start < 2
@@ -0,0 +1,68 @@
+import json
+import math
+
+import pytest
+
+from number_factorer.cli import main, completed_numbers
+
+NUMBERS = [12, 97, 1009 * 1013, 2 ** 10 * 3 ** 5, 101 * 103 * 107]
+
+def read_records(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+def check_record(record):
+    number = int(record['number'])
+
+    assert math.prod(int(p) ** n for p, n in record['factors']) == number
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / 'numbers.txt'
+    path.write_text('# numbers to factor\n' + '\n'.join(map(str, NUMBERS)) + '\n\nnot a number\n1\n')
+
+    return str(path)
+
+def test_writes_one_json_line_per_number(input_file, capsys):
+    assert main([input_file]) == 0
+
+    out, err = capsys.readouterr()
+    records = [json.loads(line) for line in out.splitlines()]
+
+    assert [int(record['number']) for record in records] == NUMBERS
+    assert all(isinstance(p, str) for record in records for p, _ in record['factors'])
+
+    for record in records:
+        check_record(record)
+
+    assert 'not an integer' in err and 'cannot factor 1' in err
+
+def test_workers_in_input_order(input_file, tmp_path):
+    output = str(tmp_path / 'out.jsonl')
+
+    assert main([input_file, '-f', 'ekera', '-a', 'babygiant', '-w', '2', '--chunksize', '2', '--ordered', '-o', output]) == 0
+    assert [int(record['number']) for record in read_records(output)] == NUMBERS
+
+def test_resume_skips_finished_numbers_and_drops_a_cut_line(input_file, tmp_path):
+    output = tmp_path / 'out.jsonl'
+    finished = json.dumps({'number': '12', 'factors': [['2', 2], ['3', 1]]})
+    output.write_text(finished + '\n' + '{"number": "97", "fac')
+
+    assert completed_numbers(str(output)) == {'12'}
+    assert output.read_text() == finished + '\n'
+
+    assert main([input_file, '-o', str(output), '--resume']) == 0
+
+    records = read_records(str(output))
+
+    assert [int(record['number']) for record in records] == NUMBERS
+
+    for record in records:
+        check_record(record)
+
+def test_argument_errors(input_file):
+    with pytest.raises(SystemExit):
+        main([input_file, '--resume'])
+
+    with pytest.raises(SystemExit):
+        main([input_file, '--cache', 'cache.sqlite', '-w', '2'])
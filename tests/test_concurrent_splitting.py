@@ -0,0 +1,43 @@
+import math
+import multiprocessing
+import time
+
+import gmpy2
+import pytest
+
+from number_factorer.Classical_Factoring.common_aux.factor_set import FactorSet
+from number_factorer.Classical_Factoring.shor_aux.concurrent_splitting import concurrent_split
+from number_factorer.Factor_Number import ShorFactorization, BabyGiantOrder, RhoOrder, BudgetedOrder
+from number_factorer.Orchestration.budget import FactoringBudget
+
+PRIMES = [101, 103, 107, 109, 113, 127]
+
+@pytest.mark.parametrize('use_threads', [False, True])
+def test_splits_every_composite(use_threads):
+    factors = FactorSet([(101 * 103, 1), (107 * 109 * 113, 2), (127, 1)])
+
+    concurrent_split(factors, BabyGiantOrder(), workers=2, use_threads=use_threads)
+
+    assert factors.pairs() == [(101, 1), (103, 1), (107, 2), (109, 2), (113, 2), (127, 1)]
+    assert multiprocessing.active_children() == []
+
+def test_shor_factorization_with_workers():
+    number = 2 ** 4 * math.prod(PRIMES)
+
+    assert sorted(ShorFactorization(workers=2).factor(number, RhoOrder())) == [(2, 4)] + [(p, 1) for p in PRIMES]
+
+@pytest.mark.parametrize('use_threads', [False, True])
+def test_deadline_stops_long_splits(use_threads):
+    # two 90-bit semiprimes are far out of reach of a second of order finding
+    p, q = int(gmpy2.next_prime(2 ** 45)), int(gmpy2.next_prime(2 ** 46))
+    r, s = int(gmpy2.next_prime(2 ** 47)), int(gmpy2.next_prime(2 ** 48))
+    factors = FactorSet([(p * q, 1), (r * s, 1)])
+
+    budget = FactoringBudget(deadline=0.5)
+    start = time.monotonic()
+
+    concurrent_split(factors, BudgetedOrder(RhoOrder(), budget), workers=2, use_threads=use_threads, budget=budget)
+
+    assert time.monotonic() - start < 3
+    assert factors.pairs() == [(p * q, 1), (r * s, 1)]
+    assert multiprocessing.active_children() == []
@@ -0,0 +1,76 @@
+import math
+import random
+
+import gmpy2
+import pytest
+
+from number_factorer.Classical_Factoring.common_aux.coprime_base import CoprimeBase, coprime_pairs, TREE_THRESHOLD
+from number_factorer.Classical_Factoring.shor_aux.refine import consolidate_pairs
+
+def product(pairs):
+    return math.prod(value ** exponent for value, exponent in pairs)
+
+def assert_coprime(pairs):
+    values = [value for value, _ in pairs]
+
+    assert all(value > 1 for value in values)
+    assert all(math.gcd(a, b) == 1 for i, a in enumerate(values) for b in values[i + 1:])
+
+def random_pairs(rng, count, primes):
+    return [(math.prod(rng.sample(primes, rng.randint(1, 3))), rng.randint(1, 3)) for _ in range(count)]
+
+PRIMES = [int(gmpy2.next_prime(10 ** 6 + 1000 * i)) for i in range(40)]
+
+@pytest.mark.parametrize('count', [0, 1, 5, TREE_THRESHOLD, 200])
+def test_refinement_keeps_the_product(count):
+    rng = random.Random(count)
+    pairs = random_pairs(rng, count, PRIMES)
+
+    base = CoprimeBase(pairs)
+
+    assert_coprime(base.pairs())
+    assert product(base.pairs()) == product(pairs)
+    assert base.pairs() == sorted(coprime_pairs(pairs).items())
+
+def test_small_example():
+    assert CoprimeBase([(6, 1), (10, 1), (15, 2)]).pairs() == [(2, 2), (3, 3), (5, 3)]
+    assert consolidate_pairs([(12, 1), (18, 1)]) == [(2, 3), (3, 3)]
+
+def test_incremental_add_and_split():
+    rng = random.Random(1)
+    primes = [int(gmpy2.next_prime(10 ** 4 + 100 * i)) for i in range(300)]
+    base = CoprimeBase()
+    pairs = []
+
+    # enough bases for several blocks with product trees
+    for value, exponent in random_pairs(rng, 150, primes):
+        base.add(value, exponent)
+        pairs.append((value, exponent))
+
+    assert_coprime(base.pairs())
+    assert product(base.pairs()) == product(pairs)
+
+    # splitting down to primes removes most bases from their blocks
+    for p in primes:
+        base.split(p)
+
+    assert product(base.pairs()) == product(pairs)
+    assert all(gmpy2.is_prime(value) for value, _ in base)
+
+    for value, exponent in random_pairs(rng, 50, primes):
+        base.add(value, exponent)
+        pairs.append((value, exponent))
+
+    assert_coprime(base.pairs())
+    assert product(base.pairs()) == product(pairs)
+
+def test_split_ignores_unrelated_divisors():
+    base = CoprimeBase([(35, 1), (11, 2)])
+    base.split(13)
+    base.split(1)
+
+    assert base.pairs() == [(11, 2), (35, 1)]
+
+    base.split(7)
+
+    assert base.pairs() == [(5, 1), (7, 1), (11, 2)]
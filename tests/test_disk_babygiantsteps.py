@@ -0,0 +1,33 @@
+import gmpy2
+import pytest
+
+from number_factorer.Factor_Number import BabyGiantOrder
+from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order
+from number_factorer.Order_Finding.Classical.disk_babygiantsteps import disk_baby_giant_order, BLOCK_SIZE
+from number_factorer.Order_Finding.Classical.order_aux.multiple_reduction import order_from_multiple
+
+# large enough for the baby-step table to span several blocks
+PRIME = int(gmpy2.next_prime(10 ** 10))
+
+@pytest.mark.parametrize('run_size', [BLOCK_SIZE // 3, 1 << 22])
+@pytest.mark.parametrize('base', [2, 3, PRIME - 1, 987654321])
+def test_matches_group_order_reduction(tmp_path, run_size, base):
+    assert disk_baby_giant_order(base, PRIME, str(tmp_path), run_size=run_size) == order_from_multiple(base, PRIME, PRIME - 1)
+
+    # the table file is removed afterwards
+    assert list(tmp_path.iterdir()) == []
+
+def test_capped_table(tmp_path):
+    for base in [2, 5]:
+        expected = order_from_multiple(base, PRIME, PRIME - 1)
+
+        assert disk_baby_giant_order(base, PRIME, str(tmp_path), max_table_entries=2 * BLOCK_SIZE) == expected
+        assert BabyGiantOrder(on_disk=True, table_dir=str(tmp_path)).find_order(base, PRIME) == expected
+
+def test_small_moduli_and_trivial_bases(tmp_path):
+    assert disk_baby_giant_order(3, 10007, str(tmp_path)) == baby_giant_order(3, 10007)
+    assert disk_baby_giant_order(PRIME + 1, PRIME, str(tmp_path)) == 1
+
+def test_modulus_too_large():
+    with pytest.raises(ValueError):
+        disk_baby_giant_order(3, 2 ** 64 + 13)
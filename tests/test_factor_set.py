@@ -0,0 +1,44 @@
+import math
+
+from number_factorer.Classical_Factoring.common_aux.factor_set import FactorSet
+
+P, Q, R = 1000003, 1000033, 1000037
+
+def test_tracks_primes_and_composites():
+    factors = FactorSet([(P * Q, 1), (R, 2)])
+
+    assert not factors.complete()
+    assert factors.composite_count() == 1
+    assert factors.composites() == [P * Q]
+
+    factors.split(P)
+
+    assert factors.complete()
+    assert factors.pairs() == [(P, 1), (Q, 1), (R, 2)]
+
+def test_perfect_powers_are_reduced_on_insert():
+    factors = FactorSet([(P ** 3 * Q ** 3, 2)])
+
+    assert factors.pairs() == [(P * Q, 6)]
+    assert factors.composites() == [P * Q]
+
+    factors.split(Q ** 2)
+
+    assert factors.pairs() == [(P, 6), (Q, 6)]
+    assert factors.complete()
+
+def test_overlapping_factors_are_refined():
+    number = P ** 2 * Q * R ** 3
+    factors = FactorSet([(P * Q, 1), (P * R, 1), (R ** 2, 1)])
+
+    assert math.prod(a ** n for a, n in factors) == number
+    assert factors.complete()
+    assert factors.pairs() == [(P, 2), (Q, 1), (R, 3)]
+
+def test_unit_and_unrelated_splits():
+    factors = FactorSet([(1, 1), (P * Q, 1)])
+
+    factors.split(R)
+    factors.split(1)
+
+    assert len(factors) == 1 and factors.composite_count() == 1
@@ -0,0 +1,75 @@
+import pickle
+import random
+
+from number_factorer.Factor_Number import Number_Factorer, ShorFactorization, IncrementOrder
+from number_factorer.Orchestration import factor_store
+from number_factorer.Orchestration.factor_store import FactorStore, TREE_THRESHOLD
+
+BIG = 2 ** 127 - 1
+
+class CountingOrder(IncrementOrder):
+    def __init__(self):
+        self.calls = 0
+
+    def find_order(self, invertible, modulus):
+        self.calls += 1
+
+        return super().find_order(invertible, modulus)
+
+def test_round_trip_and_persistence(tmp_path):
+    path = str(tmp_path / 'store.sqlite')
+    store = FactorStore(path)
+
+    store.store_factorization(3 * BIG ** 2, [(3, 1), (BIG, 2)])
+    store.store_order(BIG + 2, BIG, 126)
+    store.close()
+
+    store = FactorStore(path)
+
+    assert store.lookup_factorization(3 * BIG ** 2) == [(3, 1), (BIG, 2)]
+    assert store.lookup_factorization(5) is None
+    assert store.lookup_order(2, BIG) == 126
+    assert store.lookup_order(3, BIG) is None
+    assert sorted(store.dividing(BIG * 7)) == [BIG]
+
+def test_dividing_matches_brute_force(tmp_path):
+    store = FactorStore(str(tmp_path / 'store.sqlite'))
+    rng = random.Random(0)
+    divisors = [rng.randrange(2, 10 ** 6) for _ in range(3 * TREE_THRESHOLD)]
+    store.store_divisors(divisors)
+
+    for number in [rng.randrange(10 ** 8) for _ in range(50)] + [divisors[0] * divisors[1], divisors[2]]:
+        assert sorted(store.dividing(number)) == sorted({d for d in divisors if number % d == 0 and d < number})
+
+def test_eviction(tmp_path, monkeypatch):
+    monkeypatch.setattr(factor_store, 'EVICT_EVERY', 4)
+    store = FactorStore(str(tmp_path / 'store.sqlite'), max_entries=3)
+
+    for modulus in range(100, 120):
+        store.store_order(2, modulus, 1)
+
+    count = store.connection.execute('SELECT COUNT(*) FROM orders').fetchone()[0]
+
+    assert count <= 3 + 4
+    assert store.lookup_order(2, 119) == 1
+
+def test_copies_reopen_the_file(tmp_path):
+    store = FactorStore(str(tmp_path / 'store.sqlite'))
+    store.store_order(2, 7, 3)
+
+    copy = pickle.loads(pickle.dumps(store))
+
+    assert copy.lookup_order(2, 7) == 3
+
+def test_factorer_reuses_cached_results(tmp_path):
+    path = str(tmp_path / 'store.sqlite')
+    order_finder = CountingOrder()
+    factorer = Number_Factorer(ShorFactorization(), order_finder, cache_path=path)
+
+    assert sorted(factorer.factor(1009 * 1013)) == [(1009, 1), (1013, 1)]
+    calls = order_finder.calls
+
+    # a cached factorization and a cached divisor both avoid order finding
+    assert sorted(factorer.factor(1009 * 1013)) == [(1009, 1), (1013, 1)]
+    assert sorted(Number_Factorer(ShorFactorization(), order_finder, cache_path=path).factor(1009 * 1019)) == [(1009, 1), (1019, 1)]
+    assert order_finder.calls == calls
@@ -0,0 +1,60 @@
+import math
+import multiprocessing
+import random
+
+import gmpy2
+
+from number_factorer.Classical_Factoring.common_aux.factor_set import FactorSet
+from number_factorer.Classical_Factoring.ekera_aux.factoring_rounds import factoring_round, parallel_factoring_rounds
+from number_factorer.Factor_Number import EkeraFactorization, BabyGiantOrder
+from number_factorer.Orchestration.budget import FactoringBudget
+
+PRIMES = [1009, 1013, 1019, 1021]
+NUMBER = math.prod(PRIMES)
+
+# the odd part and the exponent of 2 of lcm(p - 1), a multiple of every order modulo NUMBER
+MULTIPLE = math.lcm(*[p - 1 for p in PRIMES])
+EVEN_EXPONENT = gmpy2.bit_scan1(MULTIPLE)
+ODD_PART = MULTIPLE >> EVEN_EXPONENT
+
+def test_factoring_round_matches_direct_gcds():
+    rng = random.Random(0)
+
+    for _ in range(20):
+        x = rng.randrange(2, NUMBER - 1)
+        expected = []
+
+        for i in range(EVEN_EXPONENT + 1):
+            y = pow(x, ODD_PART * 2 ** i, NUMBER)
+
+            if y == 1:
+                break
+
+            if math.gcd(y - 1, NUMBER) > 1:
+                expected.append(math.gcd(y - 1, NUMBER))
+
+        assert factoring_round(x, ODD_PART, EVEN_EXPONENT, NUMBER) == expected
+
+def test_parallel_rounds_complete_the_factorization():
+    rng = random.Random(1)
+    factors = FactorSet([(NUMBER, 1)])
+    draws = [rng.randrange(2, NUMBER - 1) for _ in range(40)]
+
+    parallel_factoring_rounds(factors, draws, ODD_PART, EVEN_EXPONENT, NUMBER, workers=2)
+
+    assert factors.pairs() == [(p, 1) for p in PRIMES]
+    assert multiprocessing.active_children() == []
+
+def test_expired_budget_leaves_no_workers():
+    budget = FactoringBudget(deadline=0)
+    factors = FactorSet([(NUMBER, 1)])
+
+    parallel_factoring_rounds(factors, [2, 3, 5], ODD_PART, EVEN_EXPONENT, NUMBER, workers=2, budget=budget)
+
+    assert math.prod(a ** n for a, n in factors) == NUMBER
+    assert multiprocessing.active_children() == []
+
+def test_ekera_factorization_with_workers():
+    number = 2 ** 3 * 3 * 101 * 103 * 107
+
+    assert sorted(EkeraFactorization(workers=2).factor(number, BabyGiantOrder())) == [(2, 3), (3, 1), (101, 1), (103, 1), (107, 1)]
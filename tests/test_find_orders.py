@@ -0,0 +1,22 @@
+import math
+import random
+
+import pytest
+
+from number_factorer.Factor_Number import IncrementOrder, BabyGiantOrder, RhoOrder, CachedOrder
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder, BATCH_THRESHOLD
+
+@pytest.mark.parametrize('order_finder', [IncrementOrder(), BabyGiantOrder(), RhoOrder(), CachedOrder(RhoOrder())],
+                         ids=['increment', 'bsgs', 'rho', 'cached'])
+@pytest.mark.parametrize('modulus', [15, 1009, 7919 * 13])
+def test_find_orders_matches_bad_order_finder(order_finder, modulus):
+    bases = [base for base in [2, 3, 4, 5, 6, 7, 8, 9, 10, 16, 1024, modulus - 1] if math.gcd(base, modulus) == 1]
+
+    assert order_finder.find_orders(bases, modulus) == [bad_order_finder(base, modulus) for base in bases]
+
+def test_find_order_batch_above_threshold():
+    rng = random.Random(0)
+    moduli = [rng.randrange(2, 300) for _ in range(BATCH_THRESHOLD + 10)]
+    invertibles = [rng.randrange(0, 1000) for _ in moduli]
+
+    assert IncrementOrder().find_order_batch(invertibles, moduli) == [bad_order_finder(a, m) for a, m in zip(invertibles, moduli)]
@@ -0,0 +1,29 @@
+import numpy as np
+from qiskit.quantum_info import Operator
+
+from number_factorer.Order_Finding.Quantum.quantum_aux.gate_cache import gate_cache_info, clear_gate_caches
+from number_factorer.Order_Finding.Quantum.quantum_aux.QFT import QFT, QFT_gate
+from number_factorer.Order_Finding.Quantum.quantum_aux.semi_classical_adder import phiadd, phiadd_gate
+from number_factorer.Order_Finding.Quantum.quantum_aux.mod_multiply import cmult, cmult_gate
+
+def test_repeated_calls_share_one_gate():
+    clear_gate_caches()
+
+    assert phiadd_gate(5, 4) is phiadd_gate(5, 4)
+    assert phiadd_gate(5, 4) is not phiadd_gate(6, 4)
+    assert gate_cache_info()['phiadd_gate'].hits == 2
+
+    clear_gate_caches()
+
+    assert gate_cache_info()['phiadd_gate'].currsize == 0
+
+def test_cached_gates_match_their_circuits():
+    for gate, circuit in [(QFT_gate(3), QFT(3)), (phiadd_gate(5, 4), phiadd(5, 4)), (cmult_gate(2, 3, 2), cmult(2, 3, 2))]:
+        assert np.allclose(Operator(gate).data, Operator(circuit).data)
+
+    # a gate taken from the cache is the same as a freshly built one
+    cached = cmult_gate(2, 3, 2)
+    clear_gate_caches()
+
+    assert cmult_gate(2, 3, 2) is not cached
+    assert np.allclose(Operator(cmult_gate(2, 3, 2)).data, Operator(cached).data)
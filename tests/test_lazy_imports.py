@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import number_factorer
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(number_factorer.__file__)))
+
+CLASSICAL_USE = """
+import sys
+import number_factorer.cli
+from number_factorer import Number_Factorer, ShorFactorization, EkeraFactorization, BabyGiantOrder, RhoOrder
+
+Number_Factorer(ShorFactorization(), RhoOrder()).factor(1009 * 1013)
+Number_Factorer(EkeraFactorization(), BabyGiantOrder()).factor(1009 * 1013)
+
+print(sorted(name for name in sys.modules if name.split('.')[0] in ('qiskit', 'qiskit_aer')))
+"""
+
+def test_classical_use_does_not_import_qiskit():
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run([sys.executable, '-c', CLASSICAL_USE], capture_output=True, text=True, env=env, check=True)
+
+    assert result.stdout.strip() == '[]'
@@ -0,0 +1,20 @@
+import random
+
+from number_factorer.Order_Finding.Classical.order_aux.modular_reducer import ModularReducer
+
+def test_in_place_operations_match_pow():
+    rng = random.Random(0)
+
+    for modulus in [3, 1009, 2 ** 61 - 1, 3 ** 100 + 2]:
+        reducer = ModularReducer(modulus)
+        base = rng.randrange(2, 10 * modulus)
+        x = reducer.element(base)
+
+        assert x == base % modulus
+
+        for k in range(2, 20):
+            reducer.mul(x, base)
+            assert x == pow(base, k, modulus)
+
+        reducer.square(x)
+        assert x == pow(base, 38, modulus)
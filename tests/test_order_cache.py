@@ -0,0 +1,59 @@
+from number_factorer.Factor_Number import CachedOrder, IncrementOrder
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder
+from number_factorer.Order_Finding.order_cache import OrderCache, find_orders_sharing_multiples
+
+class CountingOrder(IncrementOrder):
+    def __init__(self):
+        self.calls = 0
+
+    def find_order(self, invertible, modulus):
+        self.calls += 1
+
+        return super().find_order(invertible, modulus)
+
+def test_repeated_queries_hit_the_cache():
+    counting = CountingOrder()
+    cached = CachedOrder(counting)
+
+    assert cached.find_order(2, 1009) == bad_order_finder(2, 1009)
+    assert cached.find_order(2, 1009) == bad_order_finder(2, 1009)
+    assert cached.find_order(2 + 1009, 1009) == bad_order_finder(2, 1009)
+    assert counting.calls == 1
+
+def test_orders_dividing_the_known_multiple_are_derived():
+    counting = CountingOrder()
+    cached = CachedOrder(counting)
+
+    # 11 is a primitive root modulo 1009, so every other order divides its order
+    assert cached.find_order(11, 1009) == 1008
+
+    for base in range(2, 60):
+        assert cached.find_order(base, 1009) == bad_order_finder(base, 1009)
+
+    assert counting.calls == 1
+
+def test_power_order():
+    cached = CachedOrder(IncrementOrder())
+
+    for exponent in [1, 2, 6, 7, 1008]:
+        assert cached.find_power_order(11, exponent, 1009) == bad_order_finder(pow(11, exponent, 1009), 1009)
+
+def test_lru_bound():
+    cache = OrderCache(maxsize=2)
+
+    for base in [2, 3, 5]:
+        cache.store(base, 1009, bad_order_finder(base, 1009))
+
+    assert len(cache) == 2
+    assert (2, 1009) not in cache.orders
+
+def test_find_orders_sharing_multiples():
+    bases = [2, 3, 4, 5, 8, 9, 16]
+    calls = []
+
+    def find_order(base, modulus):
+        calls.append(base)
+        return bad_order_finder(base, modulus)
+
+    assert find_orders_sharing_multiples(find_order, bases, 1009) == [bad_order_finder(b, 1009) for b in bases]
+    assert 4 not in calls and 16 not in calls
@@ -0,0 +1,43 @@
+from fractions import Fraction
+
+import pytest
+
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder
+from number_factorer.Order_Finding.Quantum.quantum_order_finder import order_from_counts, quantum_order_finder
+
+def phase_bits(phase: Fraction, bits: int) -> str:
+    """
+    The measurement a noiseless order finding circuit gives for phase, most
+    significant bit first.
+    """
+    return format(int(phase * 2 ** bits), f'0{bits}b')
+
+@pytest.mark.parametrize('number, modulus', [(7, 15), (2, 15), (2, 21), (5, 33), (3, 35)])
+def test_coprime_phases_give_the_order(number, modulus):
+    order = bad_order_finder(number, modulus)
+    bits = 2 * modulus.bit_length()
+
+    for j in range(1, order):
+        if Fraction(j, order).denominator == order:
+            assert order_from_counts({phase_bits(Fraction(j, order), bits): 10}, number, modulus, 'shor') == order
+
+def test_divisors_of_the_order_are_combined():
+    number, modulus = 2, 21
+    order = bad_order_finder(number, modulus)
+    bits = 2 * modulus.bit_length()
+
+    # 1/2 and 1/3 only give the divisors 2 and 3 of the order 6
+    counts = {phase_bits(Fraction(1, 2), bits): 30, phase_bits(Fraction(1, 3), bits): 20, phase_bits(Fraction(0), bits): 5}
+
+    assert order_from_counts(counts, number, modulus, 'shor') == order
+
+def test_uninformative_counts():
+    assert order_from_counts({'0000000000': 64}, 7, 15, 'shor') == 0
+    assert order_from_counts({}, 7, 15, 'shor') == 0
+
+def test_order_two_needs_no_circuit():
+    def no_circuit(*args):
+        raise AssertionError('circuit built for an order 2 element')
+
+    assert quantum_order_finder(14, 15, no_circuit, 'shor') == 2
+    assert quantum_order_finder(4, 15, no_circuit, 'shor') == 2
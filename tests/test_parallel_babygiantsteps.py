@@ -0,0 +1,42 @@
+import time
+
+import gmpy2
+import pytest
+
+from number_factorer.Factor_Number import BabyGiantOrder
+from number_factorer.Order_Finding.Classical.babygiantsteps import baby_giant_order
+from number_factorer.Order_Finding.Classical.parallel_babygiantsteps import parallel_baby_giant_order, PARALLEL_THRESHOLD
+from number_factorer.Order_Finding.Classical.order_aux.multiple_reduction import order_from_multiple
+from number_factorer.Orchestration.budget import FactoringBudget, BudgetExhausted
+
+# large enough for the baby-step table to reach PARALLEL_THRESHOLD
+PRIME = int(gmpy2.next_prime(PARALLEL_THRESHOLD ** 2 + 12345))
+
+@pytest.mark.parametrize('base', [2, 3, PRIME - 1, 123456789])
+def test_matches_group_order_reduction(base):
+    expected = order_from_multiple(base, PRIME, PRIME - 1)
+
+    assert parallel_baby_giant_order(base, PRIME, workers=2) == expected
+    assert BabyGiantOrder(workers=2).find_order(base, PRIME) == expected
+
+def test_composite_modulus():
+    p, q = 65537, 65539
+    modulus = p * q
+    carmichael = int(gmpy2.lcm(p - 1, q - 1))
+
+    for base in [2, 3, 10]:
+        assert parallel_baby_giant_order(base, modulus, workers=2) == order_from_multiple(base, modulus, carmichael)
+
+def test_small_moduli_fall_back_to_the_serial_search():
+    for base in [2, 3, 5]:
+        assert parallel_baby_giant_order(base, 10007, workers=2) == baby_giant_order(base, 10007)
+
+def test_budget_stops_the_workers():
+    modulus = int(gmpy2.next_prime(10 ** 15))
+    budget = FactoringBudget(deadline=0.5)
+    start = time.monotonic()
+
+    with pytest.raises(BudgetExhausted):
+        parallel_baby_giant_order(2, modulus, workers=2, max_table_entries=PARALLEL_THRESHOLD, budget=budget)
+
+    assert time.monotonic() - start < 5
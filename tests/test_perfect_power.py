@@ -0,0 +1,32 @@
+import gmpy2
+import pytest
+
+from number_factorer.Classical_Factoring.common_aux.perfect_power import perfect_power, sieve_moduli, SIEVE_PRIMES
+
+def brute_force_power(number):
+    for exponent in range(number.bit_length(), 1, -1):
+        root, exact = gmpy2.iroot(number, exponent)
+
+        if exact:
+            return int(root), exponent
+
+    return number, 1
+
+def test_small_numbers():
+    for number in range(1, 5000):
+        assert perfect_power(number) == brute_force_power(number)
+
+@pytest.mark.parametrize('base, exponent', [(2, 64), (3, 41), (6, 12), (10 ** 6 + 3, 5), (2 ** 61 - 1, 6), (12, 35)])
+def test_large_powers(base, exponent):
+    assert perfect_power(base ** exponent) == (base, exponent)
+
+@pytest.mark.parametrize('number', [2 ** 3 * 3 ** 2, (2 ** 61 - 1) * (2 ** 31 - 1), 2 ** 64 + 1, 10 ** 40 + 1])
+def test_non_powers(number):
+    assert perfect_power(number) == (number, 1)
+
+def test_sieve_moduli():
+    for p in [2, 3, 5, 7, 31]:
+        moduli = sieve_moduli(p)
+
+        assert len(moduli) == SIEVE_PRIMES
+        assert all(gmpy2.is_prime(q) and q % p == 1 and cofactor == (q - 1) // p for q, cofactor in moduli)
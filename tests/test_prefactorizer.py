@@ -0,0 +1,64 @@
+import math
+
+import gmpy2
+
+from number_factorer.Classical_Factoring import prefactorizer as prefactorizer_module
+from number_factorer.Classical_Factoring.prefactorizer import prefactorizer
+from number_factorer.Classical_Factoring.prefactor_aux.trial_division import trial_division
+from number_factorer.Classical_Factoring.prefactor_aux.pollard_pm1 import pollard_pm1
+from number_factorer.Classical_Factoring.prefactor_aux.ecm import ecm
+from number_factorer.Factor_Number import PreFactorization, ShorFactorization, RhoOrder
+
+# 43243201 - 1 = 2^6 * 3^3 * 5^2 * 7 * 11 * 13 is smooth, 10^12 + 39 - 1 has the prime factor 26005097
+SMOOTH_PRIME = 43243201
+ROUGH_PRIME = 10 ** 12 + 39
+
+def product(pairs):
+    return math.prod(a ** n for a, n in pairs)
+
+def test_trial_division():
+    assert trial_division(2 ** 5 * 3 * 97 ** 2 * ROUGH_PRIME, 100) == ([(2, 5), (3, 1), (97, 2)], ROUGH_PRIME)
+    assert trial_division(2 * 89, 100) == ([(2, 1), (89, 1)], 1)
+
+def test_pollard_pm1_finds_the_smooth_prime():
+    assert pollard_pm1(SMOOTH_PRIME * ROUGH_PRIME, 10 ** 4) == SMOOTH_PRIME
+    assert pollard_pm1(ROUGH_PRIME * int(gmpy2.next_prime(ROUGH_PRIME)), 10 ** 4) is None
+
+def test_ecm_finds_a_divisor():
+    number = 1000003 * ROUGH_PRIME
+    d = ecm(number, 40, 2000)
+
+    assert d is not None and 1 < d < number and number % d == 0
+
+def test_full_split():
+    number = 2 ** 3 * 65537 * 1000003 ** 2 * SMOOTH_PRIME * ROUGH_PRIME
+    primes, composites = prefactorizer(number)
+
+    assert composites == []
+    assert sorted(primes) == [(2, 3), (65537, 1), (1000003, 2), (SMOOTH_PRIME, 1), (ROUGH_PRIME, 1)]
+
+def test_methods_with_zero_budget_are_skipped(monkeypatch):
+    def fail(*args):
+        raise AssertionError('called a skipped method')
+
+    monkeypatch.setattr(prefactorizer_module, 'pollard_brent', fail)
+    monkeypatch.setattr(prefactorizer_module, 'pollard_pm1', fail)
+    monkeypatch.setattr(prefactorizer_module, 'ecm', fail)
+
+    number = 3 ** 2 * 1000003 * ROUGH_PRIME
+    primes, composites = prefactorizer(number, 100, rho_iterations=0, pm1_bound=0, ecm_curves=0)
+
+    assert primes == [(3, 2)]
+    assert composites == [(1000003 * ROUGH_PRIME, 1)]
+
+def test_perfect_powers_are_reduced():
+    primes, composites = prefactorizer(ROUGH_PRIME ** 3, 100, rho_iterations=0, pm1_bound=0, ecm_curves=0)
+
+    assert (primes, composites) == ([(ROUGH_PRIME, 3)], [])
+
+def test_shor_factorization_with_prefactor():
+    number = 2 * 3 ** 4 * 101 * 65537 * 1000003
+    factors = ShorFactorization(prefactor=PreFactorization()).factor(number, RhoOrder())
+
+    assert product(factors) == number
+    assert all(gmpy2.is_prime(p) for p, _ in factors)
@@ -0,0 +1,28 @@
+import gmpy2
+import numpy as np
+import pytest
+
+from number_factorer.Classical_Factoring.common_aux.prime_sieve import primes_below, SEGMENT_SIZE
+
+def simple_primes_below(m):
+    return [q for q in range(2, m) if gmpy2.is_prime(q)]
+
+@pytest.mark.parametrize('m', [0, 1, 2, 3, 4, 11, 100, 542, 7920, 65537])
+def test_matches_primality_test(m):
+    assert primes_below(m).tolist() == simple_primes_below(m)
+
+def test_across_segments():
+    m = 2 * SEGMENT_SIZE + 12345
+    primes = primes_below(m)
+
+    assert primes.dtype == np.int64
+    assert len(primes) == len(simple_primes_below(m))
+    assert primes[-1] == gmpy2.prev_prime(m)
+    assert np.all(np.diff(primes) > 0)
+
+    # smaller queries after the table has grown are slices of it
+    assert primes_below(100).tolist() == simple_primes_below(100)
+
+def test_read_only():
+    with pytest.raises(ValueError):
+        primes_below(100)[0] = 4
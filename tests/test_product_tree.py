@@ -0,0 +1,41 @@
+import math
+import random
+
+import pytest
+
+from number_factorer.Classical_Factoring.common_aux.product_tree import product_tree, tree_product, remainder_tree
+from number_factorer.Classical_Factoring.ekera_aux import smooth_multiplier as smooth_multiplier_module
+from number_factorer.Classical_Factoring.ekera_aux.smooth_multiplier import (
+    smooth_multiplier, precompute_smooth_multipliers, load_smooth_multipliers)
+
+@pytest.mark.parametrize('count', [1, 2, 3, 8, 13, 100])
+def test_product_and_remainder_trees(count):
+    rng = random.Random(count)
+    values = [rng.randrange(2, 10 ** 12) for _ in range(count)]
+    tree = product_tree(values)
+
+    assert tree[0] == values
+    assert len(tree[-1]) == 1
+    assert tree_product(values) == math.prod(values)
+
+    number = rng.randrange(10 ** 200)
+
+    assert remainder_tree(number, tree) == [number % v for v in values]
+
+def test_empty_product():
+    assert tree_product([]) == 1
+
+@pytest.mark.parametrize('m', [2, 3, 10, 64, 1000])
+def test_smooth_multiplier_is_the_lcm_below_m(m):
+    # the largest power of every prime below m is exactly what lcm(1, ..., m - 1) contains
+    assert smooth_multiplier(m) == math.lcm(*range(1, m))
+
+def test_precomputed_multipliers_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(smooth_multiplier_module, '_loaded', {})
+    path = str(tmp_path / 'multipliers.json')
+
+    precompute_smooth_multipliers(path, [64, 128], bit_cutoff=2)
+    load_smooth_multipliers(path)
+
+    assert set(smooth_multiplier_module._loaded) == {128, 256}
+    assert smooth_multiplier(256) == math.lcm(*range(1, 256))
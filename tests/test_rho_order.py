@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from number_factorer.Factor_Number import RhoOrder
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder
+from number_factorer.Order_Finding.Classical.rho_order import rho_order
+from number_factorer.Order_Finding.Classical.order_aux.multiple_reduction import (
+    factor_integer, order_from_multiple, pollard_brent)
+
+def trial_factor(number):
+    factors = {}
+    p = 2
+
+    while p * p <= number:
+        while number % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            number //= p
+        p += 1
+
+    if number > 1:
+        factors[number] = factors.get(number, 0) + 1
+
+    return factors
+
+@pytest.mark.parametrize('modulus', [7, 15, 91, 1009, 4096, 7919 * 13, 65537])
+def test_matches_bad_order_finder(modulus):
+    rng = random.Random(modulus)
+
+    for _ in range(10):
+        base = rng.randrange(2, modulus)
+        expected = bad_order_finder(base, modulus)
+
+        assert rho_order(base, modulus) == expected
+        assert RhoOrder().find_order(base, modulus) == expected
+
+def test_trivial_cases():
+    assert rho_order(1, 101) == 1
+    assert rho_order(6, 15) is None
+
+@pytest.mark.parametrize('number', [2, 97, 2 ** 10, 3 ** 5 * 7 ** 2, 1000001, 600851475143, 101 * 103 * 10007 ** 2])
+def test_factor_integer(number):
+    assert factor_integer(number) == trial_factor(number)
+
+def test_pollard_brent_finds_a_divisor():
+    for number in [91, 8051, 10403, 1000001 * 1000003]:
+        d = pollard_brent(number)
+
+        assert 1 < d < number and number % d == 0
+
+def test_order_from_multiple():
+    for base in [2, 3, 10, 123]:
+        order = bad_order_finder(base, 10007)
+
+        assert order_from_multiple(base, 10007, 10006) == order
+        assert order_from_multiple(base, 10007, 5 * order) == order
@@ -0,0 +1,42 @@
+import gmpy2
+import pytest
+
+from number_factorer.Factor_Number import BabyGiantOrder
+from number_factorer.Order_Finding.Classical.babygiantsteps import baby_step_bound, DICT_ENTRY_BYTES
+from number_factorer.Order_Finding.Classical.bad_order_finder import bad_order_finder
+from number_factorer.Order_Finding.Classical.disk_babygiantsteps import RUN_SIZE, RUN_ENTRY_BYTES
+from number_factorer.Order_Finding.Classical.parallel_babygiantsteps import SHARED_ENTRY_BYTES
+
+def test_baby_step_bound():
+    assert baby_step_bound(101) == 10
+    assert baby_step_bound(102) == 11
+    assert baby_step_bound(10 ** 6, 50) == 50
+    assert baby_step_bound(10 ** 6, 0) == 1
+
+def test_table_entries_follow_the_tighter_budget():
+    modulus = 10 ** 12
+
+    assert BabyGiantOrder().table_entries(modulus) == 10 ** 6
+    assert BabyGiantOrder(max_table_entries=1000).table_entries(modulus) == 1000
+    assert BabyGiantOrder(memory_budget=1000 * DICT_ENTRY_BYTES).table_entries(modulus) == 1000
+    assert BabyGiantOrder(max_table_entries=10, memory_budget=1000 * DICT_ENTRY_BYTES).table_entries(modulus) == 10
+    assert BabyGiantOrder(workers=2, memory_budget=1000 * SHARED_ENTRY_BYTES).table_entries(modulus) == 1000
+
+def test_expected_memory():
+    modulus = 10 ** 12
+
+    assert BabyGiantOrder().expected_memory(modulus) == 10 ** 6 * DICT_ENTRY_BYTES
+    assert BabyGiantOrder(memory_budget=10 ** 6).expected_memory(modulus) <= 10 ** 6
+    assert BabyGiantOrder(workers=4).expected_memory(modulus) == 10 ** 6 * SHARED_ENTRY_BYTES
+
+    # a disk-backed table only holds one sorted run in RAM
+    assert BabyGiantOrder(on_disk=True).expected_memory(10 ** 18) == RUN_SIZE * RUN_ENTRY_BYTES
+    assert BabyGiantOrder(on_disk=True, memory_budget=10 ** 6).expected_memory(10 ** 18) <= 10 ** 6
+
+@pytest.mark.parametrize('memory_budget', [1, 10 * DICT_ENTRY_BYTES, 10 ** 9])
+def test_capped_searches_give_the_exact_order(memory_budget):
+    modulus = int(gmpy2.next_prime(20000)) * 7
+    order_finder = BabyGiantOrder(memory_budget=memory_budget)
+
+    for base in [2, 3, 10, 12345]:
+        assert order_finder.find_order(base, modulus) == bad_order_finder(base, modulus)